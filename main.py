@@ -1,5 +1,4 @@
 import os
-import json
 import sys
 import argparse
 import re
@@ -7,23 +6,27 @@ import traceback
 import time
 import random
 import datetime
+import functools
+import logging
+import asyncio
+import queue
+import shutil
+import collections
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Google API imports
-import gspread
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from google.auth.transport.requests import AuthorizedSession
-from googleapiclient.http import HttpRequest
+import aiohttp
+import orjson
+
+# Google API and browser-driver imports live inside the functions that need them,
+# so --url runs that never touch the sheet or a browser start faster
 
 # Selenium imports for web scraping
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.common.keys import Keys
 
 # Import our custom Quora parsing module
@@ -46,7 +49,10 @@ parser.add_argument('--max_urls', type=int,
 parser.add_argument('--debug', action='store_true',
                     help='Enable debug mode with more verbose output')
 parser.add_argument('--headless', action='store_true',
-                    help='Run Chrome in headless mode')
+                    default=True,
+                    help='Run Chrome in headless mode (default)')
+parser.add_argument('--no-headless', action='store_true',
+                    help='Show the Chrome window (useful for debugging the login flow)')
 parser.add_argument('--login', action='store_true',
                     default=True,
                     help='Login to Quora before scraping (recommended for accessing log pages)')
@@ -57,10 +63,100 @@ parser.add_argument('--credentials_file', type=str,
                     help='Path to the credentials file containing Quora login info')
 parser.add_argument('--url', type=str,
                     help='Process a single Quora URL directly, bypassing spreadsheet')
+parser.add_argument('--profile_dir', type=str,
+                    default=os.path.join(os.path.expanduser('~'), '.cache', 'quora_parser_profile'),
+                    help='Chrome user data directory, kept between runs so the Quora login is reused (empty to disable)')
+parser.add_argument('--chromedriver_version', type=str,
+                    help='Pin the ChromeDriver version to skip the online version lookup')
+parser.add_argument('--drivers', type=int,
+                    default=1,
+                    help='Number of Chrome WebDrivers scraping in parallel for URLs that need the browser')
+parser.add_argument('--rate_limit', type=int,
+                    default=20,
+                    help='Maximum answer pages opened in the browser per minute, across all drivers')
+parser.add_argument('--concurrency', type=int,
+                    default=20,
+                    help='Number of answer pages fetched concurrently over plain HTTP')
 args = parser.parse_args()
 
+# Realistic user agent shared by Chrome and the plain HTTP fetcher
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+
+# Anti-detection patches injected once per driver, before any page script runs
+STEALTH_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+window.chrome = window.chrome || {runtime: {}};
+"""
+
+# Resources Chrome never needs to download for scraping
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm",
+    # Third-party analytics, ads and tracking (reCAPTCHA is left alone for the login form)
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googlesyndication.com*", "*amazon-adsystem.com*", "*facebook.net*",
+    "*hotjar.com*", "*segment.io*", "*scorecardresearch.com*"
+]
+
+# Lock files, SQLite journals and caches that shouldn't be copied when cloning a Chrome profile
+PROFILE_COPY_IGNORE = shutil.ignore_patterns(
+    "Singleton*", "*.lock", "LOCK", "lockfile", "*-journal", "DevToolsActivePort",
+    "RunningChromeVersion", "Cache", "Code Cache", "GPUCache", "Service Worker"
+)
+
+# Login form locators - one compound XPath each so a single wait covers every variant
+EMAIL_XPATH = "//input[@id='email' or @type='email' or @name='email' or @placeholder='Email' or contains(@placeholder, 'email')]"
+PASSWORD_XPATH = "//input[@id='password' or @type='password' or @name='password' or @placeholder='Password' or contains(@placeholder, 'password')]"
+SUBMIT_XPATH = (
+    "//button[@type='submit' or contains(text(), 'Log In') or contains(text(), 'Login') or contains(@class, 'submit')]"
+    " | //input[@type='submit']"
+    " | //div[contains(@class, 'submit') or (contains(text(), 'Log in') and @role='button')]"
+)
+
+# Login button on the alternate signup page, matched case-insensitively
+_LOWER = "translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+ALT_LOGIN_BUTTON_XPATH = "//button[{}]".format(
+    " or ".join(f"contains({_LOWER}, '{text}')" for text in ("log in", "login", "sign in"))
+)
+
+# Post-login markers: avatar or user menu means logged in,
+# a login button or error message means it failed
+LOGGED_IN_XPATH = (
+    "//div[contains(@class, 'q-box') and contains(@class, 'qu-borderBottom')]//img"
+    " | //div[contains(@class, 'q-box') and contains(@class, 'qu-borderRadius--circle')]"
+)
+LOGGED_OUT_XPATH = (
+    "//button[contains(text(), 'Login') or contains(text(), 'Log In')]"
+    " | //div[contains(@class, 'error') or contains(text(), 'incorrect') or contains(text(), 'failed')]"
+)
+
+# Output goes through logging so messages are only formatted when their level is enabled
+log = logging.getLogger("quora_parser")
+
+# First row number in an A1 range such as "A2:A"
+ROW_NUMBER_RE = re.compile(r'\d+')
+
+# Format of the "scraped at" timestamp written to column M
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Sheet writes are queued here and sent in one values.batchUpdate request.
+# The lock is re-entrant because queueing can trigger a flush.
+pending_writes = []
+pending_writes_lock = threading.RLock()
+WRITE_BATCH_SIZE = 200
+
 def setup_google_api():
     """Set up Google API credentials and services"""
+    import gspread
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+    from google.auth.transport.requests import AuthorizedSession
+    from googleapiclient.http import HttpRequest
+    from requests.adapters import HTTPAdapter
+    
     scopes = [
         'https://www.googleapis.com/auth/drive',
         'https://www.googleapis.com/auth/spreadsheets',
@@ -72,7 +168,7 @@ def setup_google_api():
     if service_account_info:
         print("Using service account from environment variable")
         credentials = service_account.Credentials.from_service_account_info(
-            json.loads(service_account_info),
+            orjson.loads(service_account_info),
             scopes=scopes
         )
     else:
@@ -101,8 +197,10 @@ def setup_google_api():
             print("2. Create a credentials.json file in the current or parent directory")
             sys.exit(1)
     
-    # Create an AuthorizedSession
+    # Create an AuthorizedSession shared by Drive and gspread so both reuse one connection pool
     authed_session = AuthorizedSession(credentials)
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    authed_session.mount("https://", adapter)
     
     # Create a custom Http object that uses requests
     def build_request(http, *args, **kwargs):
@@ -110,10 +208,16 @@ def setup_google_api():
         return HttpRequest(new_http, *args, **kwargs)
     
     drive_service = build('drive', 'v3', credentials=credentials, requestBuilder=build_request)
-    gc = gspread.authorize(credentials)
+    gc = gspread.authorize(credentials, session=authed_session)
     
     return gc, drive_service
 
+@functools.lru_cache(maxsize=None)
+def load_credentials_file(path):
+    """Read and parse a JSON credentials file (cached, so retries don't re-read it)"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
 def get_quora_credentials():
     """Get Quora login credentials from environment variables or credentials file"""
     # First check environment variables
@@ -134,8 +238,7 @@ def get_quora_credentials():
     for cred_file in possible_credential_files:
         if os.path.exists(cred_file):
             try:
-                with open(cred_file, 'r') as f:
-                    creds_data = json.load(f)
+                creds_data = load_credentials_file(cred_file)
                 
                 # Try multiple possible formats
                 if 'quora_login' in creds_data:
@@ -155,22 +258,37 @@ def get_quora_credentials():
     print("Quora credentials not found. Continuing without login.")
     return None, None
 
-def setup_webdriver(headless=False):
+@functools.lru_cache(maxsize=1)
+def get_chromedriver_path():
+    """Resolve (and download if needed) the ChromeDriver binary once per run"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager(driver_version=args.chromedriver_version).install()
+
+def setup_webdriver(headless=False, user_data_dir=None):
     """Set up and configure the Selenium WebDriver"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    
     chrome_options = Options()
     if headless:
         chrome_options.add_argument("--headless=new")
     
+    # Persistent profile - cookies survive between runs so login can be skipped
+    if user_data_dir:
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+        chrome_options.add_argument("--profile-directory=Default")
+    
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
     chrome_options.add_argument("--window-size=1920,1080")
     chrome_options.add_argument("--disable-notifications")
     chrome_options.add_argument("--disable-popup-blocking")
     
     # Use a realistic user agent
-    user_agent = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
-    chrome_options.add_argument(f"--user-agent={user_agent}")
+    chrome_options.add_argument(f"--user-agent={USER_AGENT}")
     
     # Add language preference
     chrome_options.add_argument("--lang=en-US,en;q=0.9")
@@ -179,23 +297,118 @@ def setup_webdriver(headless=False):
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option("useAutomationExtension", False)
     
-    service = Service(ChromeDriverManager().install())
+    # Don't load images - only text is scraped
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2
+    })
+    
+    # Return from driver.get() at DOMContentLoaded instead of waiting for every resource
+    chrome_options.page_load_strategy = "eager"
+    
+    service = Service(get_chromedriver_path())
     driver = webdriver.Chrome(service=service, options=chrome_options)
     
     # Set page load timeout
     driver.set_page_load_timeout(60)
     
-    # Execute CDP commands to remove navigator.webdriver flag
-    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
-        "source": """
-        Object.defineProperty(navigator, 'webdriver', {
-            get: () => undefined
-        })
-        """
-    })
+    # Hide the usual automation fingerprints (navigator.webdriver, languages, plugins, window.chrome)
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_SCRIPT})
+    
+    # Drop image, font and media requests at the network layer. Stylesheets are
+    # kept because the count extractors check computed visibility.
+    parse_quora.prepare_driver(driver, BLOCKED_URL_PATTERNS)
     
     return driver
 
+def poll_until(condition, timeout, base=1.0, factor=1.5, cap=5.0):
+    """
+    Call condition() with exponential backoff between attempts until it returns
+    something truthy or the timeout (in seconds) is used up.
+    Returns the last result of condition().
+    """
+    t0 = time.monotonic()
+    attempt = 0
+    
+    while True:
+        try:
+            result = condition()
+        except Exception:
+            result = None
+        if result:
+            return result
+        
+        elapsed = time.monotonic() - t0
+        if elapsed >= timeout:
+            return result
+        
+        time.sleep(min(cap, base * (factor ** attempt), timeout - elapsed))
+        attempt += 1
+
+def wait_for_url(driver, predicate, timeout):
+    """
+    Poll driver.current_url (one WebDriver call per poll) until predicate(url) holds.
+    Returns the last URL read, lowercased, so callers don't have to fetch it again.
+    """
+    last_url = [""]
+    
+    def check():
+        last_url[0] = driver.current_url.lower()
+        return predicate(last_url[0])
+    
+    poll_until(check, timeout)
+    return last_url[0]
+
+def gs_retry(fn, max_attempts=6):
+    """
+    Wrap a gspread call so HTTP 429 (quota exceeded) responses are retried,
+    honouring Retry-After when present and backing off exponentially otherwise.
+    """
+    import gspread
+    
+    @functools.wraps(fn)
+    def wrap(*a, **k):
+        for attempt in range(max_attempts):
+            try:
+                return fn(*a, **k)
+            except gspread.exceptions.APIError as e:
+                if e.response.status_code != 429 or attempt == max_attempts - 1:
+                    raise
+                # Retry-After may also be an HTTP date - back off exponentially then
+                retry_after = e.response.headers.get("Retry-After", "")
+                delay = int(retry_after) if retry_after.isdigit() else 2 ** attempt
+                print(f"Sheets API quota exceeded, retrying in {delay}s...")
+                time.sleep(delay)
+    return wrap
+
+def find_first_interactable(driver, xpath, timeout):
+    """
+    Wait for any element matching xpath that is displayed and enabled.
+    find_elements checks every branch of a union XPath in one round-trip, while
+    element_to_be_clickable would only ever look at the first match.
+    """
+    def first_interactable(d):
+        for element in d.find_elements(By.XPATH, xpath):
+            if element.is_displayed() and element.is_enabled():
+                return element
+        return None
+    
+    return WebDriverWait(driver, timeout, poll_frequency=0.2).until(first_interactable)
+
+def has_session_cookie(driver):
+    """Check the browser's cookie store for Quora's m-b session cookie, whatever page is loaded"""
+    cookies = driver.execute_cdp_cmd("Storage.getCookies", {})["cookies"]
+    return any(cookie['name'] == 'm-b' and cookie['domain'].endswith('quora.com') for cookie in cookies)
+
+def get_login_state(driver):
+    """Return 'logged_out', 'logged_in' or None depending on which markers are on the page"""
+    if driver.find_elements(By.XPATH, LOGGED_OUT_XPATH):
+        return "logged_out"
+    if driver.find_elements(By.XPATH, LOGGED_IN_XPATH):
+        return "logged_in"
+    return None
+
 def login_to_quora(driver, email, password):
     """Login to Quora with the provided credentials"""
     try:
@@ -204,35 +417,30 @@ def login_to_quora(driver, email, password):
         
         # Navigate directly to login page instead of homepage
         driver.get("https://www.quora.com/login")
-        time.sleep(5)  # Wait longer for login page to fully load
+        
+        # Wait until the login form renders (or we land on a profile page)
+        try:
+            WebDriverWait(driver, 10, poll_frequency=0.2).until(
+                lambda d: d.find_elements(By.XPATH, EMAIL_XPATH) or "quora.com/profile/" in d.current_url
+            )
+        except TimeoutException:
+            print("Login form did not appear within 10 seconds")
         
         # Check if already logged in
         if "quora.com/profile/" in driver.current_url:
             print("Already logged in to Quora.")
             return True
             
-        # Enter email using multiple approaches
+        # Enter email
         email_entered = False
-        email_selectors = [
-            "//input[@id='email']",
-            "//input[@type='email']",
-            "//input[@name='email']",
-            "//input[@placeholder='Email']"
-        ]
-        
-        for selector in email_selectors:
-            try:
-                email_field = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, selector))
-                )
-                email_field.clear()
-                email_field.send_keys(email)
-                print(f"Entered email using selector: {selector}")
-                email_entered = True
-                break
-            except Exception as e:
-                if args.debug:
-                    print(f"Could not find email field with selector {selector}: {e}")
+        try:
+            email_field = find_first_interactable(driver, EMAIL_XPATH, 8)
+            email_field.clear()
+            email_field.send_keys(email)
+            print("Entered email")
+            email_entered = True
+        except Exception as e:
+            log.debug("Could not find email field: %s", e)
         
         # Try JavaScript if regular methods failed
         if not email_entered:
@@ -263,31 +471,16 @@ def login_to_quora(driver, email, password):
             print("ERROR: Could not find or fill email field. Quora might have changed their login form.")
             return False
             
-        # Short pause after entering email
-        time.sleep(2)
-        
-        # Enter password using multiple approaches
+        # Enter password
         password_entered = False
-        password_selectors = [
-            "//input[@id='password']",
-            "//input[@type='password']",
-            "//input[@name='password']",
-            "//input[@placeholder='Password']"
-        ]
-        
-        for selector in password_selectors:
-            try:
-                password_field = WebDriverWait(driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, selector))
-                )
-                password_field.clear()
-                password_field.send_keys(password)
-                print(f"Entered password using selector: {selector}")
-                password_entered = True
-                break
-            except Exception as e:
-                if args.debug:
-                    print(f"Could not find password field with selector {selector}: {e}")
+        try:
+            password_field = find_first_interactable(driver, PASSWORD_XPATH, 8)
+            password_field.clear()
+            password_field.send_keys(password)
+            print("Entered password")
+            password_entered = True
+        except Exception as e:
+            log.debug("Could not find password field: %s", e)
         
         # Try JavaScript if regular methods failed
         if not password_entered:
@@ -318,48 +511,25 @@ def login_to_quora(driver, email, password):
             print("ERROR: Could not find or fill password field. Quora might have changed their login form.")
             return False
             
-        # Short pause after entering password
-        time.sleep(2)
-        
         # Submit form using multiple approaches
         form_submitted = False
         
-        # Approach 1: Look for submit button with various selectors
-        submit_selectors = [
-            "//button[@type='submit']",
-            "//button[contains(text(), 'Log In')]",
-            "//button[contains(text(), 'Login')]",
-            "//button[contains(@class, 'submit')]",
-            "//input[@type='submit']",
-            "//div[contains(@class, 'submit')]",
-            "//div[contains(text(), 'Log in')][@role='button']"
-        ]
-        
-        for selector in submit_selectors:
-            try:
-                submit_button = WebDriverWait(driver, 3).until(
-                    EC.element_to_be_clickable((By.XPATH, selector))
-                )
-                submit_button.click()
-                print(f"Clicked submit button using selector: {selector}")
-                form_submitted = True
-                break
-            except Exception as e:
-                if args.debug:
-                    print(f"Could not click submit with selector {selector}: {e}")
+        # Approach 1: Look for a submit button
+        try:
+            submit_button = find_first_interactable(driver, SUBMIT_XPATH, 3)
+            submit_button.click()
+            print("Clicked submit button")
+            form_submitted = True
+        except Exception as e:
+            log.debug("Could not click submit button: %s", e)
         
         # Approach 2: Try to submit form by pressing Enter in password field
         if not form_submitted:
             try:
-                for selector in password_selectors:
-                    try:
-                        password_field = driver.find_element(By.XPATH, selector)
-                        password_field.send_keys(Keys.RETURN)
-                        print("Submitted form by pressing Enter in password field")
-                        form_submitted = True
-                        break
-                    except:
-                        continue
+                password_field = driver.find_element(By.XPATH, PASSWORD_XPATH)
+                password_field.send_keys(Keys.RETURN)
+                print("Submitted form by pressing Enter in password field")
+                form_submitted = True
             except Exception as e:
                 print(f"Enter key submission failed: {e}")
         
@@ -394,60 +564,37 @@ def login_to_quora(driver, email, password):
                         form_submitted = True
                         break
                     except Exception as e:
-                        if args.debug:
-                            print(f"JavaScript submission attempt failed: {e}")
+                        log.debug("JavaScript submission attempt failed: %s", e)
             except Exception as e:
                 print(f"All JavaScript submission attempts failed: {e}")
         
         if not form_submitted:
             print("WARNING: Could not find or click submit button. Quora might have changed their login form.")
         
-        # Wait longer for login to complete
-        time.sleep(8)
+        # Wait for the login redirect (up to 8 seconds)
+        current_url = wait_for_url(driver, lambda url: "login" not in url, 8)
         
         # Check if login was successful
-        login_successful = False
-        
-        # Method 1: Check URL
-        if "quora.com/profile/" in driver.current_url:
+        login_successful = "quora.com/profile/" in current_url
+        if login_successful:
             print("Login successful! (profile in URL)")
-            login_successful = True
-        
-        # Method 2: Check for avatar
-        try:
-            avatar = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'q-box') and contains(@class, 'qu-borderBottom')]//img"))
-            )
-            print("Login successful! (avatar found)")
-            login_successful = True
-        except:
-            print("Could not find user avatar")
-        
-        # Method 3: Check for user menu
-        try:
-            user_menu = driver.find_element(By.XPATH, "//div[contains(@class, 'q-box') and contains(@class, 'qu-borderRadius--circle')]")
-            print("Login successful! (user menu found)")
-            login_successful = True
-        except:
-            print("Could not find user menu")
+        else:
+            # One wait for whichever shows up first: a logged-in marker (avatar / user
+            # menu) or a logged-out one (login button / error message)
+            login_state = None
+            try:
+                login_state = WebDriverWait(driver, 10, poll_frequency=0.2).until(get_login_state)
+            except TimeoutException:
+                pass
             
-        # Method 4: Check if "Login" button is still present
-        try:
-            driver.find_element(By.XPATH, "//button[contains(text(), 'Login') or contains(text(), 'Log In')]")
-            print("Login button still present - login failed")
-            login_successful = False
-        except:
-            print("Login button no longer present - likely logged in")
-            login_successful = True
-        
-        # Method 5: Check for login error messages
-        try:
-            error_message = driver.find_element(By.XPATH, "//div[contains(@class, 'error') or contains(text(), 'incorrect') or contains(text(), 'failed')]")
-            error_text = error_message.text
-            print(f"Login error message found: {error_text}")
-            login_successful = False
-        except:
-            pass
+            if login_state == "logged_out":
+                print("Login button or error message still present - login failed")
+            elif login_state == "logged_in":
+                print("Login successful! (avatar or user menu found)")
+                login_successful = True
+            else:
+                print("Login button no longer present - likely logged in")
+                login_successful = True
             
         # Try an alternate login method if the standard approach failed
         if not login_successful:
@@ -455,82 +602,78 @@ def login_to_quora(driver, email, password):
             try:
                 # Go to a direct Quora login URL
                 driver.get("https://www.quora.com/signup?redirect_url=https%3A%2F%2Fwww.quora.com")
-                time.sleep(4)
                 
-                # Try to switch to email login
+                # One wait for whichever shows up first: the email form itself, or the
+                # 'Continue with Email' option that has to be clicked to reveal it
                 try:
-                    email_login_button = WebDriverWait(driver, 5).until(
-                        EC.element_to_be_clickable((By.XPATH, "//div[contains(text(), 'Continue with Email') or contains(text(), 'Email')]"))
+                    form_or_option = WebDriverWait(driver, 10, poll_frequency=0.2).until(
+                        lambda d: d.find_elements(By.XPATH, "//input[@type='password']")
+                        or d.find_elements(By.XPATH, "//div[contains(text(), 'Continue with Email') or contains(text(), 'Email')]")
                     )
-                    email_login_button.click()
-                    print("Clicked on 'Continue with Email' button")
-                    time.sleep(2)
+                    if form_or_option[0].tag_name == "input":
+                        print("Already on the email login form")
+                    else:
+                        form_or_option[0].click()
+                        print("Clicked on 'Continue with Email' button")
+                        WebDriverWait(driver, 5, poll_frequency=0.2).until(
+                            EC.presence_of_element_located((By.XPATH, "//input[@type='password']"))
+                        )
                 except Exception as e:
-                    print(f"No 'Continue with Email' button found, may already be on email form: {e}")
+                    print(f"Could not find the email login form: {e}")
                 
                 # Find email field with a broader search
                 try:
-                    all_inputs = driver.find_elements(By.XPATH, "//input")
-                    for input_field in all_inputs:
-                        input_type = input_field.get_attribute("type")
-                        placeholder = input_field.get_attribute("placeholder") or ""
-                        if input_type == "email" or "email" in placeholder.lower():
-                            input_field.clear()
-                            input_field.send_keys(email)
-                            print("Filled email field in alternate login")
-                            break
+                    # Match inputs in the page itself rather than fetching each one's attributes
+                    email_field = driver.execute_script("""
+                        for (const input of document.querySelectorAll('input')) {
+                            if (input.type === 'email' || (input.placeholder || '').toLowerCase().includes('email')) {
+                                return input;
+                            }
+                        }
+                        return null;
+                    """)
+                    if email_field:
+                        email_field.clear()
+                        email_field.send_keys(email)
+                        print("Filled email field in alternate login")
                 except Exception as e:
                     print(f"Failed to fill email in alternate login: {e}")
                 
                 # Find password field
                 try:
-                    all_inputs = driver.find_elements(By.XPATH, "//input")
-                    for input_field in all_inputs:
-                        input_type = input_field.get_attribute("type")
-                        if input_type == "password":
-                            input_field.clear()
-                            input_field.send_keys(password)
-                            input_field.send_keys(Keys.RETURN) # Try submitting with Enter key
-                            print("Filled password field and pressed Enter in alternate login")
-                            break
+                    password_field = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+                    password_field.clear()
+                    password_field.send_keys(password + Keys.RETURN) # Try submitting with Enter key
+                    print("Filled password field and pressed Enter in alternate login")
                 except Exception as e:
                     print(f"Failed to fill password in alternate login: {e}")
                 
-                # Look for any submit button
+                # Look for a login button
                 try:
-                    buttons = driver.find_elements(By.XPATH, "//button")
-                    for button in buttons:
-                        button_text = button.text.lower()
-                        if "log in" in button_text or "login" in button_text or "sign in" in button_text:
-                            button.click()
-                            print(f"Clicked '{button.text}' button in alternate login")
-                            break
+                    button = driver.find_element(By.XPATH, ALT_LOGIN_BUTTON_XPATH)
+                    button.click()
+                    print("Clicked login button in alternate login")
                 except Exception as e:
                     print(f"Failed to click login button in alternate login: {e}")
                 
-                # Wait for login to complete
-                time.sleep(8)
+                # Wait for the browser to leave the signup/login page (up to 8 seconds)
+                current_url = wait_for_url(driver, lambda url: "signup" not in url and "login" not in url, 8)
                 
                 # Check if login succeeded
-                if "quora.com/profile/" in driver.current_url:
+                if "quora.com/profile/" in current_url:
                     login_successful = True
                     print("Alternate login successful!")
             except Exception as e:
                 print(f"Alternate login attempt failed: {e}")
         
-        # Test login by trying to access a log page if we think we're logged in
-        if login_successful:
-            print("Testing login by accessing a generic Quora page...")
-            # Instead of a specific answer log page, let's visit the main profile page or home page
-            driver.get("https://www.quora.com/")
-            time.sleep(3)
-            
-            # Check if we got redirected to login
-            if "login" in driver.current_url.lower():
-                print("ERROR: Redirected to login page - login was not successful")
-                login_successful = False
+        # Confirm the session from Quora's session cookie instead of loading another page.
+        # Landing on a profile URL is already proof enough.
+        if login_successful and "quora.com/profile/" not in current_url:
+            if has_session_cookie(driver):
+                print("Found Quora session cookie - login confirmed working")
             else:
-                print("Successfully loaded Quora main page - login confirmed working")
+                print("ERROR: No Quora session cookie - login was not successful")
+                login_successful = False
         
         return login_successful
         
@@ -540,107 +683,273 @@ def login_to_quora(driver, email, password):
         
         return False
 
+def is_logged_in(driver):
+    """
+    Check whether the browser profile already has a Quora session. Any browser error
+    (slow home page, network failure) counts as not logged in, so the normal login runs.
+    """
+    try:
+        # Only load a page to verify the saved session if the profile has a session cookie at all
+        if not has_session_cookie(driver):
+            return False
+        driver.get("https://www.quora.com/")
+        return WebDriverWait(driver, 10, poll_frequency=0.2).until(get_login_state) == "logged_in"
+    except WebDriverException as e:
+        log.debug("Could not verify the saved Quora session: %s", e)
+        return False
+
+def login_driver(driver):
+    """Log a freshly created WebDriver into Quora if login was requested"""
+    if args.login and args.profile_dir and is_logged_in(driver):
+        print("Reusing Quora session from the saved browser profile - skipping login")
+        return
+    
+    if args.login:
+        quora_email, quora_password = get_quora_credentials()
+        if quora_email and quora_password:
+            login_success = login_to_quora(driver, quora_email, quora_password)
+
+            if not login_success:
+                print("\nWARNING: Failed to login to Quora. Some features may not work properly:")
+                print("  - Log pages (for exact post dates) might be inaccessible")
+                print("  - Upvote counts might be hidden behind 'View upvotes' buttons")
+                print("  - Some content might be partially shown or limited\n")
+        else:
+            print("\nWARNING: Quora credentials not found but login is required for full functionality.")
+            print("To provide credentials, either:")
+            print("1. Create a credentials.json file with 'user_email' and 'user_password' fields")
+            print("2. Set QUORA_EMAIL and QUORA_PASSWORD environment variables")
+            print("\nWithout login, these limitations apply:")
+            print("  - Log pages (for exact post dates) will likely be inaccessible")
+            print("  - Upvote counts might be hidden behind 'View upvotes' buttons")
+            print("  - Some content might be partially shown or limited\n")
+
+class DriverPool:
+    """A fixed set of pre-warmed WebDrivers handed out one at a time"""
+    
+    def __init__(self, size, headless=False, profile_dir=None, prepare=None):
+        self.headless = headless
+        self.profile_dir = profile_dir
+        self.prepare = prepare
+        self.size = size
+        self.drivers = []
+        self.slots = {}
+        self.available = queue.Queue()
+        
+        # Clone the slot profiles while no Chrome has the base profile open
+        self._copy_profiles()
+        
+        try:
+            for slot in range(size):
+                print(f"Starting WebDriver {slot + 1}/{size}...")
+                self.available.put(self._create(slot))
+        except Exception:
+            # Don't leave the drivers already started running with their profiles locked
+            self.quit()
+            raise
+    
+    def _profile_for(self, slot):
+        """Chrome can't share a profile between running instances, so each slot gets its own"""
+        if not self.profile_dir:
+            return None
+        if slot == 0:
+            return self.profile_dir
+        return f"{self.profile_dir}_{slot}"
+    
+    def _copy_profiles(self):
+        """
+        New slot profiles start as a copy of the base one, so they inherit its Quora session.
+        Must run before any driver starts, or Chrome may be writing the files being copied.
+        """
+        if not self.profile_dir or not os.path.isdir(self.profile_dir):
+            return
+        for slot in range(1, self.size):
+            slot_dir = self._profile_for(slot)
+            if not os.path.exists(slot_dir):
+                print(f"Copying browser profile for WebDriver {slot + 1}...")
+                shutil.copytree(self.profile_dir, slot_dir, ignore=PROFILE_COPY_IGNORE)
+    
+    def _create(self, slot):
+        """Start a new WebDriver and run the prepare hook (e.g. login) on it"""
+        driver = setup_webdriver(headless=self.headless, user_data_dir=self._profile_for(slot))
+        self.drivers.append(driver)
+        self.slots[driver] = slot
+        if self.prepare:
+            self.prepare(driver)
+        return driver
+    
+    def _is_alive(self, driver):
+        """Check the session with a cheap command - this also catches a crashed Chrome"""
+        try:
+            driver.title
+            return True
+        except WebDriverException:
+            return False
+    
+    def _replace(self, driver):
+        """
+        Start a new driver in place of a dead one. The pool queue holds a bare slot
+        number when the last replacement failed, so the slot is retried, not lost.
+        """
+        if isinstance(driver, int):
+            slot = driver
+        else:
+            print("WebDriver session is gone, starting a replacement...")
+            slot = self.slots.pop(driver)
+            self.drivers.remove(driver)
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        
+        try:
+            return self._create(slot)
+        except Exception:
+            self.available.put(slot)
+            raise
+    
+    @contextmanager
+    def acquire(self):
+        """Borrow a driver from the pool, replacing it first if its session died"""
+        driver = self.available.get()
+        if isinstance(driver, int) or not self._is_alive(driver):
+            driver = self._replace(driver)
+        try:
+            yield driver
+        finally:
+            self.available.put(driver)
+    
+    def quit(self):
+        """Close every driver the pool has created"""
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing WebDriver: {e}")
+
+class RateLimiter:
+    """Allow at most `rate` acquisitions per `period` seconds, shared across threads"""
+    
+    def __init__(self, rate, period=60.0):
+        self.rate = rate
+        self.period = period
+        self.calls = collections.deque()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until another call fits in the sliding window"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                while self.calls and now - self.calls[0] >= self.period:
+                    self.calls.popleft()
+                if len(self.calls) < self.rate:
+                    self.calls.append(now)
+                    return
+                wait = self.period - (now - self.calls[0])
+            time.sleep(wait)
+
+def open_spreadsheet(gc, spreadsheet_id):
+    """Open the spreadsheet, falling back to the ID with a trailing 'q' added or removed"""
+    import gspread
+    
+    alt_id = spreadsheet_id[:-1] if spreadsheet_id.endswith('q') else spreadsheet_id + 'q'
+    for candidate in (spreadsheet_id, alt_id):
+        print(f"Attempting to open spreadsheet with ID: {candidate}")
+        try:
+            return gs_retry(gc.open_by_key)(candidate)
+        except gspread.exceptions.SpreadsheetNotFound:
+            print(f"ERROR: Spreadsheet {candidate} not found or access denied.")
+    
+    print("Possible reasons:")
+    print("1. The spreadsheet ID is incorrect")
+    print("2. The service account email doesn't have access to this spreadsheet")
+    print(f"   - Make sure to share the spreadsheet with the service account email")
+    return None
+
 def get_urls_from_sheet(gc, spreadsheet_id, sheet_name, url_range, max_urls=None):
     """Get URLs from the specified Google Sheet, only those not processed yet"""
+    import gspread
+    
     try:
-        print(f"Attempting to open spreadsheet with ID: {spreadsheet_id}")
+        spreadsheet = open_spreadsheet(gc, spreadsheet_id)
+        if not spreadsheet:
+            return [], None, None
+        print(f"Successfully opened spreadsheet: '{spreadsheet.title}'")
+        
+        # List available worksheets
+        print("\nAvailable worksheets:")
+        worksheets = gs_retry(spreadsheet.worksheets)()
+        for worksheet in worksheets:
+            print(f"- {worksheet.title}")
+        
+        # Try to open the specified worksheet
         try:
-            spreadsheet = gc.open_by_key(spreadsheet_id)
-            print(f"Successfully opened spreadsheet: '{spreadsheet.title}'")
-            
-            # List available worksheets
-            print("\nAvailable worksheets:")
-            for worksheet in spreadsheet.worksheets():
-                print(f"- {worksheet.title}")
+            # Pick it from the metadata already fetched rather than requesting it again
+            sheet = next((w for w in worksheets if w.title == sheet_name), None)
+            if sheet is None:
+                raise gspread.exceptions.WorksheetNotFound(sheet_name)
+            print(f"\nOpened worksheet: '{sheet_name}'")
             
-            # Try to open the specified worksheet
-            try:
-                sheet = spreadsheet.worksheet(sheet_name)
-                print(f"\nOpened worksheet: '{sheet_name}'")
-                
-                # Get URLs from specified range
-                all_data = sheet.get_all_values()
-                all_rows = len(all_data)
-                print(f"Sheet has {all_rows} rows in total")
-                
-                # Ensure we're starting from row 2 to skip the header
-                if url_range.startswith('A1:'):
-                    url_range = 'A2:' + url_range.split(':')[1]
-                    print(f"Adjusted URL range to skip header: {url_range}")
-                    
-                # Get URLs and processed status
-                start_row = int(re.search(r'\d+', url_range.split(':')[0]).group())
-                urls_data = sheet.get_values(url_range)
-                processed_flags = sheet.get_values(f'P{start_row}:P{start_row + len(urls_data)}')
+            # Row count comes from the worksheet metadata - no need to download every cell
+            print(f"Sheet has {sheet.row_count} rows in total")
                 
-                print(f"Found {len(urls_data)} URLs in range {url_range}")
-                
-                # Extend processed_flags if needed
-                if len(processed_flags) < len(urls_data):
-                    processed_flags.extend([['FALSE']] * (len(urls_data) - len(processed_flags)))
-                
-                # Extract URLs and limit if needed
-                processed_urls = []
-                processed_count = 0
-                unprocessed_count = 0
-                
-                for i, (url_row, flag_row) in enumerate(zip(urls_data, processed_flags), start=start_row):
-                    if not url_row or not url_row[0].strip():
-                        continue
-                    
-                    # Check if the URL has already been processed
-                    processed = flag_row and flag_row[0].strip().upper() == 'TRUE'
-                    
-                    if processed:
-                        processed_count += 1
-                        if args.debug:
-                            print(f"Skipping already processed URL at row {i}: {url_row[0]}")
-                    else:
-                        unprocessed_count += 1
-                        if url_row and url_row[0].strip():
-                            processed_urls.append({
-                                'row': i,
-                                'url': url_row[0].strip().replace("@", ""),
-                            })
-                            if max_urls and len(processed_urls) >= max_urls:
-                                break
-                
-                print(f"Found {processed_count} already processed URLs and {unprocessed_count} unprocessed URLs")
-                print(f"Returning {len(processed_urls)} URLs to process (limited by max_urls={max_urls})")
-                return processed_urls, sheet, spreadsheet
-            
-            except gspread.exceptions.WorksheetNotFound:
-                print(f"ERROR: Worksheet '{sheet_name}' not found in this spreadsheet.")
-                print("Available worksheets:", [w.title for w in spreadsheet.worksheets()])
+            # Get URLs and processed status in a single batchGet request. Reading
+            # by column returns one flat list per range with trailing blanks trimmed.
+            # The processed flags start on the same row as the URLs - only look at the range's start cell
+            row_match = ROW_NUMBER_RE.search(url_range.split(':')[0])
+            if not row_match:
+                print(f"ERROR: URL range '{url_range}' must start with a row number, e.g. 'A2:A'.")
                 return [], None, None
-                
-        except gspread.exceptions.SpreadsheetNotFound:
-            print("ERROR: Spreadsheet not found or access denied.")
-            print("Possible reasons:")
-            print("1. The spreadsheet ID is incorrect")
-            print("2. The service account email doesn't have access to this spreadsheet")
-            print(f"   - Make sure to share the spreadsheet with the service account email")
+            start_row = int(row_match.group())
+            url_values, flag_values = gs_retry(spreadsheet.values_batch_get)([
+                sheet_range(sheet_name, url_range),
+                sheet_range(sheet_name, f'P{start_row}:P')
+            ], params={
+                "majorDimension": "COLUMNS",
+                "valueRenderOption": "UNFORMATTED_VALUE"
+            })['valueRanges']
+            urls_data = (url_values.get('values') or [[]])[0]
+            processed_flags = (flag_values.get('values') or [[]])[0]
             
-            # Try alternate ID formats
-            if spreadsheet_id.endswith('q'):
-                alt_id = spreadsheet_id[:-1]
-                print(f"\nTrying alternate ID without 'q': {alt_id}")
-                try:
-                    spreadsheet = gc.open_by_key(alt_id)
-                    print(f"Success with alternate ID! Spreadsheet title: '{spreadsheet.title}'")
-                    return get_urls_from_sheet(gc, alt_id, sheet_name, url_range, max_urls)
-                except Exception as e:
-                    print(f"Also failed with alternate ID: {e}")
-            else:
-                alt_id = spreadsheet_id + 'q'
-                print(f"\nTrying alternate ID with 'q' appended: {alt_id}")
-                try:
-                    spreadsheet = gc.open_by_key(alt_id)
-                    print(f"Success with alternate ID! Spreadsheet title: '{spreadsheet.title}'")
-                    return get_urls_from_sheet(gc, alt_id, sheet_name, url_range, max_urls)
-                except Exception as e:
-                    print(f"Also failed with alternate ID: {e}")
+            print(f"Found {len(urls_data)} URLs in range {url_range}")
+            
+            # Extend processed_flags if needed
+            if len(processed_flags) < len(urls_data):
+                processed_flags.extend([False] * (len(urls_data) - len(processed_flags)))
+            
+            # Extract URLs and limit if needed
+            processed_urls = []
+            processed_count = 0
+            unprocessed_count = 0
+            
+            for i, (url, flag) in enumerate(zip(urls_data, processed_flags), start=start_row):
+                url = str(url).strip()
+                if not url:
+                    continue
+                
+                # Check if the URL has already been processed (checkboxes come back as booleans)
+                processed = str(flag).strip().upper() == 'TRUE'
+                
+                if processed:
+                    processed_count += 1
+                    log.debug("Skipping already processed URL at row %s: %s", i, url)
+                else:
+                    unprocessed_count += 1
+                    processed_urls.append({
+                        'row': i,
+                        'url': url.replace("@", ""),
+                    })
+                    if max_urls and len(processed_urls) >= max_urls:
+                        break
             
+            print(f"Found {processed_count} already processed URLs and {unprocessed_count} unprocessed URLs")
+            print(f"Returning {len(processed_urls)} URLs to process (limited by max_urls={max_urls})")
+            return processed_urls, sheet, spreadsheet
+        
+        except gspread.exceptions.WorksheetNotFound:
+            print(f"ERROR: Worksheet '{sheet_name}' not found in this spreadsheet.")
+            print("Available worksheets:", [w.title for w in worksheets])
             return [], None, None
     
     except Exception as e:
@@ -648,95 +957,194 @@ def get_urls_from_sheet(gc, spreadsheet_id, sheet_name, url_range, max_urls=None
         print(f"Traceback: {traceback.format_exc()}")
         return [], None, None
 
-def is_quora_url(url):
-    """Check if the URL is a Quora URL"""
-    return "quora.com" in url
+async def fetch_one(url_data, session, sem, executor):
+    """Fetch one answer page over HTTP and parse it off the event loop"""
+    url = url_data['url']
+    async with sem:
+        try:
+            async with session.get(url) as response:
+                if response.status != 200:
+                    print(f"HTTP fetch for {url} returned status {response.status}")
+                    return url_data, None
+                html = await response.text()
+                final_url = str(response.url)
+        except Exception as e:
+            print(f"HTTP fetch failed for {url}: {e}")
+            return url_data, None
 
-def process_quora_urls(quora_urls, driver, sheet):
-    """Process a list of Quora URLs and update the spreadsheet with the results"""
-    results = []
-    
-    for url_data in quora_urls:
-        row = url_data['row']
-        url = url_data['url']
-        
-        print(f"\nProcessing URL from row {row}: {url}")
-        
-        # Scrape the answer data
-        result = parse_quora.scrape_quora_answer(driver, url)
+    # Redirected to a login page - needs the browser
+    if "login" in final_url.lower():
+        return url_data, None
+
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(executor, parse_quora.parse_html, html, url)
+    return url_data, result
+
+async def fetch_all(urls, session, sem):
+    """Fetch and parse all answer pages concurrently, returning (url_data, result) pairs"""
+    # Parse in a worker thread so the event loop keeps downloading the next pages
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return await asyncio.gather(*(fetch_one(url_data, session, sem, executor) for url_data in urls))
+
+async def fetch_all_quora_pages(urls, concurrency):
+    """Set up the HTTP session and run fetch_all over the URLs"""
+    sem = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+    headers = {"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"}
+    timeout = aiohttp.ClientTimeout(total=60)
+
+    async with aiohttp.ClientSession(connector=connector, headers=headers, timeout=timeout) as session:
+        return await fetch_all(urls, session, sem)
+
+def sheet_range(sheet_name, a1_range):
+    """Qualify an A1 range with its (quoted) worksheet name"""
+    return "'{}'!{}".format(sheet_name.replace("'", "''"), a1_range)
+
+def queue_range_write(sheet, a1_range, values):
+    """Queue a write of a 2D list of values to a range, flushing once the batch is full"""
+    with pending_writes_lock:
+        pending_writes.append({
+            "range": sheet_range(sheet.title, a1_range),
+            "values": values
+        })
+        if len(pending_writes) >= WRITE_BATCH_SIZE:
+            flush_pending_writes(sheet.spreadsheet)
+
+def flush_pending_writes(spreadsheet):
+    """Send all queued range writes in a single batchUpdate request"""
+    with pending_writes_lock:
+        if not pending_writes:
+            return
         
-        if "error" in result:
-            print(f"Error processing URL: {result['error']}")
-            continue
-            
-        # Update the spreadsheet with the scraped data
         try:
-            # Column B - Base Thread URL
-            sheet.update_cell(row, 2, result['base_url'])
-            
-            # Column G - Username (Author)
-            sheet.update_cell(row, 7, result['author'])
-            
-            # Column H - Post Date
-            sheet.update_cell(row, 8, result['post_date'])
-            
-            # Column I - Views
-            sheet.update_cell(row, 9, result['stats']['views'])
-            
-            # Column J - Upvotes
-            sheet.update_cell(row, 10, result['stats']['upvotes'])
-            
-            # Column K - Comments
-            sheet.update_cell(row, 11, result['stats']['comments'])
-            
-            # Column L - Shares
-            sheet.update_cell(row, 12, result['stats']['shares'])
-            
-            # Column M - Timestamp (when scraped)
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            sheet.update_cell(row, 13, timestamp)
-            
-            # Column P - Mark as processed
-            sheet.update_cell(row, 16, "TRUE")
-            
-            print(f"Successfully updated sheet for row {row}")
-            
-            # Add delay to avoid rate limits
-            time.sleep(2)
-            
+            gs_retry(spreadsheet.values_batch_update)(body={
+                "valueInputOption": "USER_ENTERED",
+                "data": pending_writes
+            })
+            print(f"Flushed {len(pending_writes)} range updates to the spreadsheet")
+            pending_writes.clear()
         except Exception as e:
-            print(f"Error updating spreadsheet for row {row}: {e}")
-            
-        # Add result to the list
-        results.append({
-            "row": row,
-            "data": result
-        })
+            print(f"Error flushing {len(pending_writes)} range updates to the spreadsheet: {e}")
+
+def update_sheet_row(sheet, row, result):
+    """Queue the scraped data for one row to be written to the spreadsheet"""
+    try:
+        # Column B - Base Thread URL
+        queue_range_write(sheet, f"B{row}", [[result['base_url']]])
+        
+        # Columns G-M - Author, Post Date, Views, Upvotes, Comments, Shares, Timestamp (when scraped)
+        timestamp = datetime.datetime.now().strftime(TIMESTAMP_FORMAT)
+        queue_range_write(sheet, f"G{row}:M{row}", [[
+            result['author'],
+            result['post_date'],
+            result['stats']['views'],
+            result['stats']['upvotes'],
+            result['stats']['comments'],
+            result['stats']['shares'],
+            timestamp
+        ]])
         
-        # Add delay between requests to avoid being flagged as a bot
-        delay = random.uniform(3, 7)
-        print(f"Waiting {delay:.2f} seconds before next URL...")
+        # Column P - Mark as processed
+        queue_range_write(sheet, f"P{row}", [["TRUE"]])
+        
+        print(f"Queued sheet update for row {row}")
+        
+    except Exception as e:
+        print(f"Error queueing spreadsheet update for row {row}: {e}")
+
+def print_result(result):
+    """Print the extracted data for a single answer"""
+    print("\nExtracted data:")
+    print(f"Answer URL: {result['answer_url']}")
+    print(f"Thread URL: {result['base_url']}")
+    print(f"Author: {result['author']}")
+    print(f"Post date: {result['post_date']}")
+    print(f"Views: {result['stats']['views']}")
+    print(f"Upvotes: {result['stats']['upvotes']}")
+    print(f"Comments: {result['stats']['comments']}")
+    print(f"Shares: {result['stats']['shares']}")
+    print(f"Scraped at: {result['scraped_at']}")
+
+def process_quora_url(url_data, pool, sheet, limiter):
+    """Scrape one Quora URL with a pooled driver and queue its spreadsheet update"""
+    row = url_data['row']
+    url = url_data['url']
+    
+    # Scrape the answer data
+    with pool.acquire() as driver:
+        limiter.acquire()
+        log.info("Processing URL from row %s: %s", row, url)
+        result = parse_quora.scrape_quora_answer(driver, url)
+        
+        # Each driver pauses on its own before its next URL to avoid being flagged as a bot,
+        # while the other drivers keep working
+        delay = random.uniform(2, 4)
+        log.debug("Waiting %.2f seconds before this driver's next URL...", delay)
         time.sleep(delay)
     
+    if "error" in result:
+        log.error("Error processing URL: %s", result['error'])
+        return None
+        
+    # Update the spreadsheet with the scraped data
+    update_sheet_row(sheet, row, result)
+    
+    return {
+        "row": row,
+        "data": result
+    }
+
+def process_quora_urls(quora_urls, pool, sheet):
+    """Process a list of Quora URLs across the driver pool and update the spreadsheet with the results"""
+    results = []
+    
+    # Global cap on page loads; the pause in process_quora_url only spaces out one driver
+    limiter = RateLimiter(args.rate_limit)
+    
+    with ThreadPoolExecutor(max_workers=pool.size) as executor:
+        futures = [executor.submit(process_quora_url, url_data, pool, sheet, limiter) for url_data in quora_urls]
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                log.error("Error processing URL: %s", e)
+                continue
+            if result:
+                results.append(result)
+    
+    # Keep the summary in sheet order
+    results.sort(key=lambda result: result["row"])
     return results
 
 def main():
     """Main function to run the Quora parser"""
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO, format="%(asctime)s %(message)s", stream=sys.stdout)
+    
     try:
         # Check if --no-login flag was used (overrides --login)
         if args.no_login:
-            print("No-login flag specified - will skip login")
+            log.info("No-login flag specified - will skip login")
             args.login = False
-            
-        # Setup Google API
-        gc, drive_service = setup_google_api()
         
-        # Check if we're testing a single URL
+        # Check if --no-headless flag was used (overrides --headless)
+        if args.no_headless:
+            args.headless = False
+            
+        # Check if we're testing a single URL (no spreadsheet access needed)
         if args.url:
-            print(f"\nProcessing single URL mode: {args.url}")
+            log.info("Processing single URL mode: %s", args.url)
             quora_urls = [{'row': 1, 'url': args.url}]
             sheet = None
+            spreadsheet = None
         else:
+            # Ensure we're starting from row 2 to skip the header
+            if args.url_column.startswith('A1:'):
+                args.url_column = 'A2:' + args.url_column.split(':')[1]
+                log.info("Adjusted URL range to skip header: %s", args.url_column)
+            
+            # Setup Google API
+            gc, drive_service = setup_google_api()
+            
             # Get URLs from sheet
             urls, sheet, spreadsheet = get_urls_from_sheet(
                 gc, 
@@ -747,96 +1155,126 @@ def main():
             )
             
             if not urls:
-                print("No unprocessed URLs found or could not access spreadsheet.")
+                log.info("No unprocessed URLs found or could not access spreadsheet.")
                 return
             
-            print(f"\nSuccessfully retrieved {len(urls)} unprocessed URLs to process")
+            log.info("Successfully retrieved %s unprocessed URLs to process", len(urls))
             
-            # Filter for Quora URLs
-            quora_urls = [url for url in urls if is_quora_url(url['url'])]
-            non_quora_urls = [url for url in urls if not is_quora_url(url['url'])]
+            # Split Quora and non-Quora URLs in a single pass
+            quora_urls, non_quora_urls = [], []
+            for url in urls:
+                (quora_urls if "quora.com" in url['url'] else non_quora_urls).append(url)
             
-            print(f"Found {len(quora_urls)} Quora URLs and {len(non_quora_urls)} non-Quora URLs")
+            log.info("Found %s Quora URLs and %s non-Quora URLs", len(quora_urls), len(non_quora_urls))
             
             if not quora_urls:
-                print("No Quora URLs found to process.")
+                log.info("No Quora URLs found to process.")
                 return
             
-        # Set up the WebDriver
-        print("\nSetting up WebDriver...")
-        driver = setup_webdriver(headless=args.headless)
-        
         try:
-            # Login to Quora if requested
-            if args.login:
-                quora_email, quora_password = get_quora_credentials()
-                if quora_email and quora_password:
-                    login_success = login_to_quora(driver, quora_email, quora_password)
-                    
-                    if not login_success:
-                        print("\nWARNING: Failed to login to Quora. Some features may not work properly:")
-                        print("  - Log pages (for exact post dates) might be inaccessible")
-                        print("  - Upvote counts might be hidden behind 'View upvotes' buttons")
-                        print("  - Some content might be partially shown or limited\n")
+            # Fetch pages over plain HTTP first; only pages that need login/JS go to Selenium
+            log.info("Fetching %s Quora URLs over HTTP (concurrency: %s)...", len(quora_urls), args.concurrency)
+            fetched = asyncio.run(fetch_all_quora_pages(quora_urls, args.concurrency))
+        
+            results = []
+            browser_urls = []
+            http_results = []
+            for url_data, result in fetched:
+                if result is None:
+                    browser_urls.append(url_data)
                 else:
-                    print("\nWARNING: Quora credentials not found but login is required for full functionality.")
-                    print("To provide credentials, either:")
-                    print("1. Create a credentials.json file with 'user_email' and 'user_password' fields")
-                    print("2. Set QUORA_EMAIL and QUORA_PASSWORD environment variables")
-                    print("\nWithout login, these limitations apply:")
-                    print("  - Log pages (for exact post dates) will likely be inaccessible")
-                    print("  - Upvote counts might be hidden behind 'View upvotes' buttons")
-                    print("  - Some content might be partially shown or limited\n")
+                    http_results.append((url_data, result))
             
-            # Process the Quora URLs
-            print("\nProcessing Quora URLs...")
+            # Pages that don't embed their creation date get it from their log pages, which
+            # need the browser's login cookies - so any of those also start the WebDriver pool
+            undated = [(url_data, result) for url_data, result in http_results if not result['post_date']]
             
-            # Special case for single URL mode (no spreadsheet updates)
-            if args.url:
-                for url_data in quora_urls:
-                    url = url_data['url']
-                    print(f"\nProcessing URL: {url}")
-                    
-                    # Scrape the answer data
-                    result = parse_quora.scrape_quora_answer(driver, url)
+            pool = None
+            if browser_urls or undated:
+                # Set up the WebDriver pool (each driver is logged in as it starts)
+                log.info("Setting up WebDriver...")
+                pool = DriverPool(
+                    min(args.drivers, len(browser_urls) + len(undated)),
+                    headless=args.headless,
+                    profile_dir=args.profile_dir,
+                    prepare=login_driver
+                )
+            
+            try:
+                if undated:
+                    log.info("Fetching log pages for %s answers without an embedded post date...", len(undated))
+                    with pool.acquire() as driver:
+                        session = parse_quora.get_http_session(driver)
+                    post_dates = parse_quora.extract_post_dates(session, [url_data['url'] for url_data, _ in undated])
+                    for (url_data, result), post_date in zip(undated, post_dates):
+                        result['post_date'] = post_date
+                
+                for url_data, result in http_results:
+                    # Still no date - the browser can read the log page when logged in
+                    if not result['post_date']:
+                        browser_urls.append(url_data)
+                        continue
                     
-                    if "error" in result:
-                        print(f"Error processing URL: {result['error']}")
+                    if args.url:
+                        print_result(result)
                     else:
-                        # Print the results directly
-                        print("\nExtracted data:")
-                        print(f"Answer URL: {result['answer_url']}")
-                        print(f"Thread URL: {result['base_url']}")
-                        print(f"Author: {result['author']}")
-                        print(f"Post date: {result['post_date']}")
-                        print(f"Views: {result['stats']['views']}")
-                        print(f"Upvotes: {result['stats']['upvotes']}")
-                        print(f"Comments: {result['stats']['comments']}")
-                        print(f"Shares: {result['stats']['shares']}")
-                        print(f"Scraped at: {result['scraped_at']}")
-            else:
-                # Normal mode - update spreadsheet
-                results = process_quora_urls(quora_urls, driver, sheet)
+                        update_sheet_row(sheet, url_data['row'], result)
+                    results.append({
+                        "row": url_data['row'],
+                        "data": result
+                    })
+                
+                log.info("Parsed %s URLs over HTTP, %s need the browser", len(results), len(browser_urls))
                 
+                if browser_urls:
+                    # Process the Quora URLs
+                    log.info("Processing Quora URLs...")
+                
+                    # Special case for single URL mode (no spreadsheet updates)
+                    if args.url:
+                        for url_data in browser_urls:
+                            url = url_data['url']
+                            log.info("Processing URL: %s", url)
+                        
+                            # Scrape the answer data
+                            with pool.acquire() as driver:
+                                result = parse_quora.scrape_quora_answer(driver, url)
+                        
+                            if "error" in result:
+                                log.error("Error processing URL: %s", result['error'])
+                            else:
+                                # Print the results directly
+                                print_result(result)
+                    else:
+                        # Normal mode - update spreadsheet
+                        results.extend(process_quora_urls(browser_urls, pool, sheet))
+            
+            finally:
+                if pool:
+                    # Close the WebDrivers
+                    log.info("Closing WebDriver...")
+                    pool.quit()
+        
+            if not args.url:
                 # Print summary
-                print("\nProcessing complete! Summary:")
+                log.info("Processing complete! Summary:")
                 for result in results:
-                    row = result["row"]
                     data = result["data"]
-                    print(f"Row {row}: {data['author']} - Views: {data['stats']['views']}, Upvotes: {data['stats']['upvotes']}, Comments: {data['stats']['comments']}, Shares: {data['stats']['shares']}")
-                    print(f"  Thread URL: {data['base_url']}")
-                    print(f"  Answer URL: {data['answer_url']}")
-                    print(f"  Post date: {data['post_date']}")
-                    print("---")
-        
+                    stats = data['stats']
+                    log.info(
+                        "Row %s: %s - Views: %s, Upvotes: %s, Comments: %s, Shares: %s\n"
+                        "  Thread URL: %s\n  Answer URL: %s\n  Post date: %s\n---",
+                        result["row"], data['author'], stats['views'], stats['upvotes'], stats['comments'], stats['shares'],
+                        data['base_url'], data['answer_url'], data['post_date']
+                    )
+    
         finally:
-            # Close the WebDriver
-            print("\nClosing WebDriver...")
-            driver.quit()
+            # Send any sheet updates still queued
+            if spreadsheet:
+                flush_pending_writes(spreadsheet)
     
     except Exception as e:
-        print(f"Error in main execution: {e}")
-        print(traceback.format_exc())
+        log.error("Error in main execution: %s", e, exc_info=True)
 
 if __name__ == "__main__":
     main()
@@ -2,11 +2,13 @@ import time
 import re
 import datetime
 import json
-from urllib.parse import urlparse, urlunsplit
-from selenium import webdriver
+import functools
+import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, unquote
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
 # Import args from main for debug flag
@@ -18,33 +20,552 @@ except ImportError:
         debug = False
     args = Args()
 
+# Shares main's logger, so the step-by-step output only shows with --debug
+log = logging.getLogger("quora_parser")
+
+# Markers in raw HTML meaning the page can't be parsed without a logged-in browser
+LOGIN_WALL_MARKERS = [
+    "You need to login to view this page",
+    "This content isn't available right now",
+    "Quora deleted this"
+]
+LOGIN_WALL_RE = re.compile("|".join(re.escape(marker) for marker in LOGIN_WALL_MARKERS))
+
+# Visible text on log pages that are behind a login wall or otherwise unavailable
+RESTRICTED_PAGE_TEXTS = [
+    "Something went wrong",
+    "You need to login to view this page",
+    "Log in to Quora",
+    "Page not found",
+    "This content isn't available right now",
+    "Error",
+    "The page you requested was not found"
+]
+RESTRICTED_PAGE_XPATH = "//body//*[not(self::script or self::style)][{}]".format(
+    " or ".join(f'contains(text(), "{text}")' for text in RESTRICTED_PAGE_TEXTS)
+)
+
+# Date shapes found on answer log pages
+MONTH_NAMES = "January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec"
+# "January 5, 2023 at 3:04 PM" | "January 5, 2023" | "5 January 2023", tried in that order
+ANY_DATE_RE = re.compile(
+    rf"(?P<tm>{MONTH_NAMES}) (?P<td>\d{{1,2}}), (?P<ty>\d{{4}}) at (?P<h>\d{{1,2}}):(?P<mi>\d{{2}})(?::(?P<s>\d{{2}}))? (?P<ampm>[APM]{{2}})"
+    rf"|(?P<sm>{MONTH_NAMES}) (?P<sd>\d{{1,2}}), (?P<sy>\d{{4}})"
+    rf"|(?P<ad>\d{{1,2}}) (?P<am>{MONTH_NAMES}),? (?P<ay>\d{{4}})"
+)
+
+# Displayed counts such as "1.2K views" or "View 35 upvotes"
+COUNT_MULTIPLIERS = {'k': 1000, 'm': 1000000}
+VIEWS_RE = re.compile(r"(?P<num>\d+(?:,\d+)*(?:\.\d+)?)(?P<mult>[KkMm])?\s+views?")
+UPVOTES_RE = re.compile(r"(?:view\s+)?(?P<num>\d+(?:,\d+)*(?:\.\d+)?)(?P<mult>[KkMm])?\s+upvotes?", re.IGNORECASE)
+COMMENTS_RE = re.compile(r"(?P<num>\d+(?:,\d+)*(?:\.\d+)?)(?P<mult>[KkMm])?\s+comments?", re.IGNORECASE)
+SHARES_RE = re.compile(r"(?:view\s+)?(?P<num>\d+(?:,\d+)*(?:\.\d+)?)(?P<mult>[KkMm])?\s+shares?", re.IGNORECASE)
+COUNT_TEXT_RE = re.compile(r"(?P<num>\d+(?:,\d+)*(?:\.\d+)?)(?P<mult>[KkMm])?\s+(?:upvote|comment|share)s?", re.IGNORECASE)
+NON_DIGITS_RE = re.compile(r"\D+")
+
+# Element locators tried in order by the author and view extractors
+AUTHOR_SELECTORS = (
+    "div.q-box a.qu-bold > span",
+    "div.q-box span.qu-bold",
+    "span.qu-bold--done",
+    "div.qu-borderBottom span.qu-bold"
+)
+VIEW_XPATHS = (
+    "//span[contains(text(), 'views')]",
+    "//div[contains(text(), 'views')]",
+    "//span[contains(@class, 'c1h7helg')]"
+)
+
+# Elements showing "N upvotes/comments/shares" text, each list queried as one union
+UPVOTE_TEXT_XPATH = " | ".join((
+    "//span[contains(text(), 'upvotes')]",
+    "//div[contains(text(), 'upvotes')]",
+    "//div[contains(@class, 'qu-color--gray_light')]//span[contains(@class, 'c1h7helg')][contains(text(), 'upvotes')]"
+))
+COMMENT_TEXT_XPATH = " | ".join((
+    "//span[contains(text(), 'comments')]",
+    "//div[contains(text(), 'comments')]"
+))
+SHARE_TEXT_XPATH = " | ".join((
+    "//span[contains(text(), 'shares')]",
+    "//div[contains(text(), 'shares')]",
+    "//div[contains(@class, 'qu-color--gray_light')]//span[contains(@class, 'c1h7helg')][contains(text(), 'shares')]"
+))
+
+# Notices shown in place of an answer that has been deleted, queried as one union
+DELETION_XPATH = " | ".join((
+    "//div[contains(text(), 'Quora deleted this answer')]",
+    "//div[contains(text(), 'deleted by Quora Moderation')]",
+    "//div[contains(text(), 'Quora deleted this')]"
+))
+
+# URL patterns each WebDriver blocks all the time, keyed by WebDriver session id
+base_blocked_urls = {}
+
+# Log pages are only read for their text, so stylesheets can be skipped there too
+LOG_PAGE_BLOCKED_URLS = ["*.css"]
+
+# requests sessions with each WebDriver's cookies, keyed by WebDriver session id
+http_sessions = {}
+
+# Log pages fetched at once by extract_post_dates - the work is almost all waiting on the network
+LOG_FETCH_WORKERS = 16
+
+# Background threads fetching log pages over HTTP while the browser keeps extracting
+log_prefetch_executor = ThreadPoolExecutor(max_workers=LOG_FETCH_WORKERS)
+
+LD_JSON_RE = re.compile(r'<script[^>]*type="application/ld\+json"[^>]*>(.*?)</script>', re.DOTALL)
+
+# Links to answers in the raw page HTML, used to cut out one answer's markup
+ANSWER_LINK_RE = re.compile(r'href="([^"]*/answer/[^"]*)"')
+
+# CSS selectors that show a page has rendered enough to scrape
+LOG_PAGE_READY_SELECTORS = ("span.c1h7helg", "span.q-text")
+ANSWER_PAGE_READY_SELECTORS = ("span.q-text",)
+
+# Answer-page finder scripts, installed into every page by prepare_driver so each
+# call only sends the finder's name instead of its whole source (see run_finder)
+AUTHOR_FINDER_JS = """
+    for (const selector of arguments[0]) {
+        for (const element of document.querySelectorAll(selector)) {
+            const name = element.textContent.trim();
+            if (name.length > 1 && !/answer/i.test(name)) {
+                return name;
+            }
+        }
+    }
+    return null;
+"""
+
+UPVOTE_SPECIFIC_FINDER_JS = """
+    // Find upvote buttons by aria-label
+    const upvoteButtons = document.querySelectorAll('button[aria-label*="Upvote" i]');
+    
+    // Cheap layout checks first; computed style is only read once, for a numeric candidate
+    const isShown = span => {
+        if (span.offsetParent === null || span.getClientRects().length === 0) return false;
+        const style = getComputedStyle(span);
+        return style.opacity !== '0' && style.visibility !== 'hidden';
+    };
+    
+    for (const button of upvoteButtons) {
+        // Return the first visible span with only digits (short, to avoid large ID numbers)
+        for (const span of button.getElementsByTagName('span')) {
+            const text = span.textContent.trim();
+            if (/^\\d{1,9}$/.test(text) && isShown(span)) {
+                return text;
+            }
+        }
+    
+        // Also try to find the span with the exact structure from the example
+        for (const span of button.querySelectorAll('.q-text.qu-whiteSpace--nowrap.qu-display--inline-flex.qu-alignItems--center.qu-justifyContent--center')) {
+            const text = span.textContent.trim();
+            if (/^\\d{1,9}$/.test(text)) {
+                return text;
+            }
+        }
+    }
+    
+    return null;
+"""
+
+UPVOTE_GENERAL_FINDER_JS = """
+    // Only look at spans inside upvote buttons instead of every span on the page,
+    // accepting numbers that aren't laid out yet as long as they aren't faded out
+    for (const button of document.querySelectorAll('button[aria-label*="Upvote" i]')) {
+        for (const span of button.getElementsByTagName('span')) {
+            const text = span.textContent.trim();
+            if (/^\\d{1,9}$/.test(text) && getComputedStyle(span).opacity !== '0') {  // Avoid large ID numbers
+                return text;
+            }
+        }
+    }
+    
+    return null;
+"""
+
+COMMENT_SPECIFIC_FINDER_JS = """
+    // Find comment buttons by aria-label
+    let commentButtons = Array.from(document.querySelectorAll('button[aria-label*="comment" i]'));
+    
+    for (let button of commentButtons) {
+        // Look for the structure matching the example: 
+        // The visible span inside the second div of the button content
+        const visibleSpans = Array.from(button.querySelectorAll('div > div:nth-child(2) > span:not([class*="visibility--hidden"])'))
+            .filter(span => span.textContent.trim().match(/^\\d+$/));
+    
+        if (visibleSpans.length > 0) {
+            return visibleSpans[0].textContent.trim();
+        }
+    }
+    
+    return null;
+"""
+
+COMMENT_GENERAL_FINDER_JS = """
+    // Find comment buttons by aria-label
+    let commentButtons = Array.from(document.querySelectorAll('button[aria-label*="comment" i], button[aria-label*="Comment" i]'));
+    
+    for (let button of commentButtons) {
+        // Find spans with text content that is just a number
+        let spans = Array.from(button.getElementsByTagName('span'));
+        for (let span of spans) {
+            let text = span.textContent.trim();
+            if (text && /^\\d+$/.test(text) && getComputedStyle(span).opacity !== '0') {
+                return text;
+            }
+        }
+    
+        // Also check for number in the button text
+        let buttonText = button.textContent.trim();
+        let match = buttonText.match(/\\d+/);
+        if (match) {
+            return match[0];
+        }
+    }
+    
+    return null;
+"""
+
+META_FINDER_JS = """
+    const author = (function() {%(author)s}).apply(null, arguments);
+    const views = document.body.innerText.match(/\\d+(?:,\\d+)*(?:\\.\\d+)?[KkMm]?\\s+views?/);
+    // Creation date of this answer's JSON-LD node, same lookup as find_answer_ld
+    const normalizePath = url => {
+        try {
+            return decodeURIComponent(new URL(url, location.href).pathname).replace(/\\/+$/, '').toLowerCase();
+        } catch (e) {
+            return null;
+        }
+    };
+    const answerPath = normalizePath(arguments[1]);
+    let created = null;
+    for (const script of document.querySelectorAll('script[type="application/ld+json"]')) {
+        let stack;
+        try {
+            stack = [JSON.parse(script.textContent)];
+        } catch (e) {
+            continue;
+        }
+        while (stack.length && !created) {
+            const node = stack.pop();
+            if (node && typeof node === 'object') {
+                if (node['@type'] === 'Answer' && normalizePath(node.url || '') === answerPath) {
+                    created = node.dateCreated || node.datePublished || null;
+                }
+                stack.push(...Object.values(node));
+            }
+        }
+        if (created) break;
+    }
+    return {author: author, views: views ? views[0] : null, created: created};
+""" % {"author": AUTHOR_FINDER_JS}
+
+COUNTS_FINDER_JS = """
+    // The per-field button finders, so their selectors live in one place
+    const findUpvote = () => (function() {%(upvote_specific)s})() || (function() {%(upvote_general)s})();
+    const findComment = () => (function() {%(comment_specific)s})() || (function() {%(comment_general)s})();
+    
+    function findShareButton() {
+        for (const button of document.querySelectorAll('button[aria-label*="Share"]')) {
+            const text = button.innerText.trim();
+            if (/^\\d+$/.test(text)) return text;
+        }
+        return null;
+    }
+    
+    // One walk over the text nodes collects the first "N upvotes/comments/shares" of each kind
+    function gatherCounts() {
+        const found = {};
+        const countText = /\\d+(?:,\\d+)*(?:\\.\\d+)?[KkMm]?\\s+(upvote|comment|share)s?/gi;
+        const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+        let node;
+        while (Object.keys(found).length < 3 && (node = walker.nextNode())) {
+            for (const match of node.nodeValue.matchAll(countText)) {
+                const kind = match[1].toLowerCase() + 's';
+                if (!(kind in found)) found[kind] = match[0];
+            }
+        }
+        return found;
+    }
+    
+    const texts = gatherCounts();
+    return {
+        upvotes: findUpvote() || texts.upvotes || null,
+        comments: findComment() || texts.comments || null,
+        shares: texts.shares || findShareButton()
+    };
+""" % {
+    "upvote_specific": UPVOTE_SPECIFIC_FINDER_JS,
+    "upvote_general": UPVOTE_GENERAL_FINDER_JS,
+    "comment_specific": COMMENT_SPECIFIC_FINDER_JS,
+    "comment_general": COMMENT_GENERAL_FINDER_JS,
+}
+
+# Stream the page's text nodes and stop at the first view count
+VIEWS_FINDER_JS = """
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    let node;
+    while ((node = walker.nextNode())) {
+        if (/\\d+(?:,\\d+)*(?:\\.\\d+)?[KkMm]?\\s+views?/.test(node.nodeValue)) {
+            return node.nodeValue.trim();
+        }
+    }
+    return null;
+"""
+
+# Same for the first share count
+SHARES_FINDER_JS = """
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    let node;
+    while ((node = walker.nextNode())) {
+        const match = node.nodeValue.match(/\\d+(?:,\\d+)*(?:\\.\\d+)?[KkMm]?\\s+shares?/i);
+        if (match) {
+            return match[0];
+        }
+    }
+    return null;
+"""
+
+# Everything scrape_quora_answer needs from a loaded answer page in one call, built
+# from the meta and counts finders; the third argument is the deletion notice XPath
+ANSWER_FINDER_JS = f"""
+    const meta = (function() {{{META_FINDER_JS}}}).apply(null, arguments);
+    const counts = (function() {{{COUNTS_FINDER_JS}}})();
+    const deleted = document.evaluate(arguments[2], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+    return {{deleted: deleted, meta: meta, counts: counts}};
+"""
+
+PAGE_FINDERS = {
+    "meta": META_FINDER_JS,
+    "author": AUTHOR_FINDER_JS,
+    "counts": COUNTS_FINDER_JS,
+    "views": VIEWS_FINDER_JS,
+    "upvote_specific": UPVOTE_SPECIFIC_FINDER_JS,
+    "upvote_general": UPVOTE_GENERAL_FINDER_JS,
+    "comment_specific": COMMENT_SPECIFIC_FINDER_JS,
+    "comment_general": COMMENT_GENERAL_FINDER_JS,
+    "shares": SHARES_FINDER_JS,
+    "answer": ANSWER_FINDER_JS,
+}
+PAGE_FINDERS_SCRIPT = "window.__qf = {%s};" % ", ".join(
+    f"{name}: function() {{{source}}}" for name, source in PAGE_FINDERS.items()
+)
+
+def prepare_driver(driver, blocked_urls):
+    """
+    Enable CDP network control on a new WebDriver, block the given URL patterns
+    and install the page finder scripts into every page it loads
+    """
+    base_blocked_urls[driver.session_id] = list(blocked_urls)
+    driver.execute_cdp_cmd("Network.enable", {})
+    set_blocked_urls(driver)
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": PAGE_FINDERS_SCRIPT})
+
+def run_finder(driver, name, *args):
+    """Run one of the PAGE_FINDERS in the current page and return its result"""
+    # Wrapped in a list so a finder returning null can be told apart from a missing install
+    result = driver.execute_script(f"return window.__qf ? [window.__qf.{name}(...arguments)] : null;", *args)
+    if result is None:
+        # Page loaded without the installed finders - send the whole script instead
+        return driver.execute_script(PAGE_FINDERS[name], *args)
+    return result[0]
+
+def set_blocked_urls(driver, extra=()):
+    """Block the driver's base URL patterns plus any extra ones, replacing the previous list"""
+    urls = base_blocked_urls.get(driver.session_id, []) + list(extra)
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+
+def return_to_answer(driver, original_url, restore_url=True):
+    """Lift the log-page-only blocking and, unless told not to, navigate back to the answer page"""
+    set_blocked_urls(driver)
+    if restore_url:
+        driver.get(original_url)
+        wait_ready(driver, ANSWER_PAGE_READY_SELECTORS)
+
+def wait_ready(driver, selectors, timeout=8):
+    """
+    Wait until the document is parsed and any of the CSS selectors matches.
+    Checked with one script call per poll; returns False on timeout.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+            lambda d: d.execute_script(
+                "return document.readyState !== 'loading' && !!document.querySelector(arguments[0]);",
+                ", ".join(selectors)
+            )
+        )
+        return True
+    except TimeoutException:
+        time.sleep(0.2)
+        return False
+
+def wait_for_counts_ready(driver, timeout=10):
+    """
+    Wait until the answer's upvote button or a deletion notice has rendered,
+    polling with one script call; returns False on timeout.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+            lambda d: d.execute_script(
+                """
+                return document.readyState !== 'loading' && (
+                    !!document.querySelector(arguments[0])
+                    || document.evaluate(arguments[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null
+                );
+                """,
+                'button[aria-label*="Upvote" i]', DELETION_XPATH
+            )
+        )
+        return True
+    except TimeoutException:
+        return False
+
+def parse_date_match(match):
+    """Turn an ANY_DATE_RE match into a (datetime, formatted date) pair, or None if it isn't a valid date"""
+    if match.group('tm'):
+        month, day, year = match.group('tm'), match.group('td'), match.group('ty')
+    elif match.group('sm'):
+        month, day, year = match.group('sm'), match.group('sd'), match.group('sy')
+    else:
+        month, day, year = match.group('am'), match.group('ad'), match.group('ay')
+    date_text = f"{month} {day}, {year}"
+    
+    # Abbreviated month names ("Jan") need %b instead of %B
+    date_format = "%b %d, %Y" if len(month) == 3 and month != "May" else "%B %d, %Y"
+    try:
+        date = datetime.datetime.strptime(date_text, date_format)
+    except ValueError:
+        # Date-like text that isn't a real date, e.g. "February 30, 2023"
+        return None
+    
+    if not match.group('tm'):
+        return date, date_text  # Midnight
+    
+    # Convert the 12-hour time by hand rather than with %I, so "0:30 AM" and "13:30 PM" still parse
+    hour = int(match.group('h'))
+    if match.group('ampm') == "PM" and hour < 12:
+        hour += 12
+    elif match.group('ampm') == "AM" and hour == 12:
+        hour = 0
+    
+    formatted_date = f"{date_text} at {match.group('h')}:{match.group('mi')}"
+    if match.group('s'):
+        formatted_date += f":{match.group('s')}"
+    formatted_date += f" {match.group('ampm')}"
+    
+    try:
+        return date.replace(hour=hour, minute=int(match.group('mi')), second=int(match.group('s') or 0)), formatted_date
+    except ValueError:
+        # A time that can't be right (e.g. 25:00) - keep just the date
+        return date, date_text
+
+def find_earliest_date(html):
+    """Return the earliest date found anywhere in the HTML, formatted, or None"""
+    # One streaming pass covers all three date shapes; only the running minimum is kept
+    parsed_dates = (parse_date_match(match) for match in ANY_DATE_RE.finditer(html))
+    earliest = min((parsed for parsed in parsed_dates if parsed), key=lambda parsed: parsed[0], default=None)
+    return earliest[1] if earliest else None
+
+def get_http_session(driver):
+    """Return a requests session carrying the WebDriver's Quora cookies, created once per driver session"""
+    session = http_sessions.get(driver.session_id)
+    if session is None:
+        session = requests.Session()
+        session.headers['User-Agent'] = driver.execute_script("return navigator.userAgent")
+        # One pooled connection per worker so extract_post_dates' parallel fetches don't queue for a socket
+        session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=LOG_FETCH_WORKERS))
+        for cookie in driver.get_cookies():
+            session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'), path=cookie.get('path', '/'))
+        http_sessions[driver.session_id] = session
+    return session
+
+def get_log_url(answer_url):
+    """Return the log page URL for an answer URL"""
+    # Log URLs always end with /log or are direct log revision URLs
+    if not answer_url.endswith("/log") and "/log/" not in answer_url:
+        return answer_url + "/log"
+    return answer_url
+
+def fetch_log_page_date(driver, log_url):
+    """Fetch the log page over plain HTTP with the browser's cookies and return its earliest date"""
+    return fetch_post_date(get_http_session(driver), log_url)
+
+def prefetch_log_page_date(driver, answer_url):
+    """Start fetching the answer's log page date over HTTP in the background, returning a future"""
+    # The session is built here since it needs the driver, which the background thread mustn't use
+    session = get_http_session(driver)
+    return log_prefetch_executor.submit(fetch_post_date, session, get_log_url(answer_url))
+
+def extract_post_dates(session, urls):
+    """
+    Fetch the log pages of many answers in parallel over HTTP and return their
+    post dates in the same order as urls, with None where no date was found.
+    Log pages are mostly behind Quora's login wall, so pass a session carrying a
+    logged-in browser's cookies (get_http_session) - an anonymous one gets few dates.
+    """
+    with ThreadPoolExecutor(max_workers=LOG_FETCH_WORKERS) as executor:
+        return list(executor.map(lambda url: fetch_post_date(session, get_log_url(url)), urls))
+
+def fetch_post_date(session, log_url):
+    """
+    Fetch a log page with the given requests session and return the earliest
+    date in it, or None if the page is unavailable or has no dates.
+    """
+    try:
+        response = session.get(log_url, timeout=20)
+    except requests.RequestException as e:
+        print(f"HTTP fetch of log page failed: {e}")
+        return None
+    
+    if response.status_code != 200 or "login" in response.url.lower() or LOGIN_WALL_RE.search(response.text):
+        return None
+    return find_earliest_date(response.text)
+
+def count_from_match(match):
+    """Convert a count regex match such as "1,234", "1.2K" or "3M" to a plain digit string"""
+    number = match.group('num').replace(',', '')
+    suffix = match.group('mult')
+    if not suffix:
+        return number
+    return str(int(float(number) * COUNT_MULTIPLIERS[suffix.lower()]))
+
+def extract_all_meta(driver, answer_url):
+    """
+    Read the author, view count and embedded creation date from the loaded
+    answer page in a single script call. Fields that can't be found are None,
+    so callers can fall back to the per-field extractors for just those.
+    """
+    try:
+        meta = run_finder(driver, "meta", AUTHOR_SELECTORS, answer_url)
+    except Exception as e:
+        print(f"Error extracting answer metadata: {e}")
+        return {'author': None, 'views': None, 'post_date': None}
+    return meta_from_finder(meta)
+
+def meta_from_finder(meta):
+    """Turn the raw result of the meta finder into the author, view count and formatted post date"""
+    views_match = VIEWS_RE.search(meta['views'] or '')
+    return {
+        'author': meta['author'],
+        'views': count_from_match(views_match) if views_match else None,
+        'post_date': format_iso_date(meta['created']) if meta['created'] else None,
+    }
+
 def extract_author_name(driver):
     """Extract the name of the person who posted the answer"""
     try:
-        # Try multiple possible selectors for author name
-        selectors = [
-            "//div[contains(@class, 'q-box')]//a[contains(@class, 'qu-bold')]/span",
-            "//div[contains(@class, 'q-box')]//span[contains(@class, 'qu-bold')]",
-            "//span[contains(@class, 'qu-bold--done')]",
-            "//div[contains(@class, 'qu-borderBottom')]//span[contains(@class, 'qu-bold')]"
-        ]
-        
-        for selector in selectors:
-            try:
-                author_elements = driver.find_elements(By.XPATH, selector)
-                for element in author_elements:
-                    name = element.text.strip()
-                    if name and len(name) > 1 and "answer" not in name.lower():
-                        print(f"Found author name: {name}")
-                        return name
-            except:
-                continue
+        # Try multiple possible selectors for author name, all inside the browser in one call
+        name = run_finder(driver, "author", AUTHOR_SELECTORS)
+        if name:
+            log.debug("Found author name: %s", name)
+            return name
                 
         # Try getting from page URL as fallback
         current_url = driver.current_url
         if '/answer/' in current_url:
             username = current_url.split('/answer/')[1].split('/')[0].replace('-', ' ')
-            print(f"Extracted author name from URL: {username}")
+            log.debug("Extracted author name from URL: %s", username)
             return username
             
         return "Name not found"
@@ -53,383 +574,176 @@ def extract_author_name(driver):
         print(f"Error extracting author name: {e}")
         return "Error extracting name"
 
-def extract_post_date(driver, answer_url):
+def extract_post_date(driver, answer_url, restore_url=True, check_embedded=True, log_date_future=None):
     """
     Extract the date when the post was created.
-    Focuses on extracting the exact creation date from the log page.
+    Uses the creation date embedded in the answer page when there is one,
+    otherwise extracts the exact creation date from the log page.
     The earliest date in the log represents the original post date.
+    Pass restore_url=False when the caller is done with the answer page,
+    so the browser stays where it is instead of loading the answer again,
+    check_embedded=False when the embedded date was already looked for, and
+    log_date_future when the HTTP log page fetch was already started with
+    prefetch_log_page_date.
     """
     # Get current date information for fallback
     system_now = datetime.datetime.now()
     
     original_url = driver.current_url
     
-    # Log URLs always end with /log or are direct log revision URLs
-    if not answer_url.endswith("/log") and "/log/" not in answer_url:
-        log_url = answer_url + "/log"
-    else:
-        log_url = answer_url
-    
-    print(f"Navigating to log page: {log_url}")
-    driver.get(log_url)
-    time.sleep(5)  # Wait for log page to load
-    
-    # Check if we hit a login wall or error page
-    page_source = driver.page_source
-    restricted_access = False
+    log_url = get_log_url(answer_url)
     
-    # Check for access restriction indicators
-    login_indicators = [
-        "Something went wrong", 
-        "You need to login to view this page", 
-        "login" in driver.current_url.lower(),
-        "Log in to Quora",
-        "Page not found",
-        "This content isn't available right now",
-        "Error",
-        "The page you requested was not found"
-    ]
+    # The answer page usually embeds its creation date already - only visit the log page without it
+    if check_embedded:
+        try:
+            embedded_date = find_embedded_post_date(driver.page_source, answer_url)
+            if embedded_date:
+                log.debug("Found post date embedded in the answer page: %s", embedded_date)
+                return embedded_date
+        except Exception as e:
+            print(f"Error reading embedded post date: {e}")
     
-    for indicator in login_indicators:
-        if isinstance(indicator, str) and indicator in page_source:
-            restricted_access = True
-            break
+    # Try the log page over plain HTTP before loading it in the browser
+    if log_date_future is not None:
+        log_date = log_date_future.result()
+    else:
+        log_date = fetch_log_page_date(driver, log_url)
+    if log_date:
+        log.debug("Found earliest date on log page over HTTP: %s", log_date)
+        return log_date
     
-    if not restricted_access:
-        try:
-            # Look for dates via JavaScript
-            date_spans_js = """
-            // Find all spans with the specific classes that might contain dates
-            const dateSpans = Array.from(document.querySelectorAll('span.c1h7helg.c8970ew'));
-            
-            // Add a fallback for other common date classes
-            if (dateSpans.length === 0) {
-                // Try alternative date selectors (common in Quora)
-                const alternativeDateSpans = Array.from(document.querySelectorAll('span.q-text.qu-dynamicFontSize--small, span.q-text.qu-color--gray_light, span[class*="qu-color--gray"]'));
-                dateSpans.push(...alternativeDateSpans);
-            }
-            
-            // If still no date spans, try a more general approach to find spans with date-like content
-            if (dateSpans.length === 0) {
-                const allSpans = Array.from(document.querySelectorAll('span'));
-                const possibleDateSpans = allSpans.filter(span => {
-                    const text = span.textContent.trim();
-                    // Look for patterns like "January 1, 2023" or "Jan 1, 2023"
-                    return (
-                        /^(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\\s+\\d{1,2},\\s+\\d{4}/.test(text) ||
-                        /\\d{1,2}\\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)\\s+\\d{4}/.test(text)
-                    );
+    log.debug("Navigating to log page: %s", log_url)
+    set_blocked_urls(driver, LOG_PAGE_BLOCKED_URLS)
+    try:
+        driver.get(log_url)
+        wait_ready(driver, LOG_PAGE_READY_SELECTORS)
+        
+        # Check if we hit a login wall or error page - the URL and all the error texts are
+        # checked in the browser in one call, stopping at the first matching element
+        page_state = driver.execute_script("""
+            const loginWall = location.href.toLowerCase().includes('login');
+            return {
+                loginWall: loginWall,
+                restricted: loginWall
+                    || document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null
+            };
+        """, RESTRICTED_PAGE_XPATH)
+        restricted_access = page_state['restricted']
+        
+        if not restricted_access:
+            try:
+                # Look for dates via JavaScript
+                date_spans_js = """
+                // Find all spans with the specific classes that might contain dates
+                const dateSpans = Array.from(document.querySelectorAll('span.c1h7helg.c8970ew'));
+                
+                // Add a fallback for other common date classes
+                if (dateSpans.length === 0) {
+                    // Try alternative date selectors (common in Quora)
+                    const alternativeDateSpans = Array.from(document.querySelectorAll('span.q-text.qu-dynamicFontSize--small, span.q-text.qu-color--gray_light, span[class*="qu-color--gray"]'));
+                    dateSpans.push(...alternativeDateSpans);
+                }
+                
+                // If still no date spans, try a more general approach to find spans with date-like content
+                if (dateSpans.length === 0) {
+                    const allSpans = Array.from(document.getElementsByTagName('span'));
+                    const possibleDateSpans = allSpans.filter(span => {
+                        const text = span.textContent.trim();
+                        // Look for patterns like "January 1, 2023" or "Jan 1, 2023"
+                        return (
+                            /^(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\\s+\\d{1,2},\\s+\\d{4}/.test(text) ||
+                            /\\d{1,2}\\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)\\s+\\d{4}/.test(text)
+                        );
+                    });
+                    dateSpans.push(...possibleDateSpans);
+                }
+                
+                // Return only the date text itself, matched with the same shapes as ANY_DATE_RE
+                const month = `(?:${arguments[0]})`;
+                const dateRe = new RegExp(
+                    `${month} \\\\d{1,2}, \\\\d{4} at \\\\d{1,2}:\\\\d{2}(?::\\\\d{2})? [AP]M` +
+                    `|${month} \\\\d{1,2}, \\\\d{4}` +
+                    `|\\\\d{1,2} ${month},? \\\\d{4}`
+                );
+                return dateSpans.flatMap(span => {
+                    const match = span.textContent.match(dateRe);
+                    return match ? [match[0]] : [];
                 });
-                dateSpans.push(...possibleDateSpans);
-            }
-            
-            // Map them to their text content
-            return dateSpans.map(span => span.textContent.trim());
-            """
-            
-            date_spans = driver.execute_script(date_spans_js)
-            
-            if date_spans and len(date_spans) > 0:
-                print(f"Found {len(date_spans)} potential date spans:")
+                """
                 
-                # Process all spans, focusing on finding the earliest date
-                all_found_dates = []
+                date_spans = driver.execute_script(date_spans_js, MONTH_NAMES)
                 
-                for i, span_text in enumerate(date_spans):
-                    print(f"  Span #{i+1}: '{span_text}'")
+                if date_spans and len(date_spans) > 0:
+                    log.debug("Found %s dates in log page spans:", len(date_spans))
                     
-                    # Look for dates with time pattern (most specific)
-                    time_date_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) (\d{1,2}), (\d{4}) at (\d{1,2}):(\d{2})(?::(\d{2}))? ([APM]{2})', span_text)
+                    # The log lists revisions newest-first, so walk it from the end: the first
+                    # full date with time found there is the original post date
+                    all_found_dates = []
+                    earliest_date_tuple = None
                     
-                    if time_date_match:
-                        print(f"  Found date with time in span #{i+1}")
-                        formatted_date = span_text
+                    for i, span_text in enumerate(reversed(date_spans)):
+                        log.debug("  Span #%s: '%s'", len(date_spans) - i, span_text)
                         
-                        # Store this date for comparison
-                        try:
-                            # Parse the date to allow finding the earliest one
-                            month = time_date_match.group(1)
-                            day = int(time_date_match.group(2))
-                            year = int(time_date_match.group(3))
-                            hour = int(time_date_match.group(4))
-                            minute = int(time_date_match.group(5))
-                            
-                            # Adjust for AM/PM
-                            if time_date_match.group(7) == "PM" and hour < 12:
-                                hour += 12
-                            elif time_date_match.group(7) == "AM" and hour == 12:
-                                hour = 0
-                                
-                            # Create a datetime object for comparison
-                            if time_date_match.group(6):  # If seconds are included
-                                second = int(time_date_match.group(6))
-                            else:
-                                second = 0
-                            
-                            # Convert month name to month number
-                            month_map = {
-                                'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
-                                'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12,
-                                'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-                                'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                            }
-                            month_num = month_map.get(month, 1)  # Default to 1 if not found
-                            
-                            date_obj = datetime.datetime(year, month_num, day, hour, minute, second)
-                            all_found_dates.append((date_obj, formatted_date))
-                        except Exception as e:
-                            print(f"    Error parsing date for comparison: {e}")
-                    
-                    # Try simpler date pattern if full pattern didn't match
-                    date_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) (\d{1,2}), (\d{4})', span_text)
-                    if date_match and not time_date_match:
-                        print(f"  Found simple date in span #{i+1}")
-                        formatted_date = f"{date_match.group(1)} {date_match.group(2)}, {date_match.group(3)}"
+                        # One search covers all three date shapes
+                        date_match = ANY_DATE_RE.search(span_text)
+                        if not date_match:
+                            continue
                         
-                        # Store this date for comparison
-                        try:
-                            # Parse the date to allow finding the earliest one
-                            month = date_match.group(1)
-                            day = int(date_match.group(2))
-                            year = int(date_match.group(3))
-                            
-                            # Convert month name to month number
-                            month_map = {
-                                'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
-                                'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12,
-                                'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-                                'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                            }
-                            month_num = month_map.get(month, 1)  # Default to 1 if not found
-                            
-                            # Use midnight as time
-                            date_obj = datetime.datetime(year, month_num, day, 0, 0, 0)
-                            all_found_dates.append((date_obj, formatted_date))
-                        except Exception as e:
-                            print(f"    Error parsing date for comparison: {e}")
-                    
-                    # Try alternative date formats (e.g., "1 Jan 2023")
-                    alt_date_match = re.search(r'(\d{1,2}) (January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec),? (\d{4})', span_text)
-                    if alt_date_match and not time_date_match and not date_match:
-                        print(f"  Found alternative date format in span #{i+1}")
-                        formatted_date = f"{alt_date_match.group(2)} {alt_date_match.group(1)}, {alt_date_match.group(3)}"
+                        parsed = parse_date_match(date_match)
+                        if not parsed:
+                            log.debug("    Could not parse date in span #%s", len(date_spans) - i)
+                            continue
                         
-                        # Store this date for comparison
-                        try:
-                            # Parse the date to allow finding the earliest one
-                            day = int(alt_date_match.group(1))
-                            month = alt_date_match.group(2)
-                            year = int(alt_date_match.group(3))
-                            
-                            # Convert month name to month number
-                            month_map = {
-                                'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
-                                'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12,
-                                'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-                                'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                            }
-                            month_num = month_map.get(month, 1)  # Default to 1 if not found
-                            
-                            # Use midnight as time
-                            date_obj = datetime.datetime(year, month_num, day, 0, 0, 0)
-                            all_found_dates.append((date_obj, formatted_date))
-                        except Exception as e:
-                            print(f"    Error parsing date for comparison: {e}")
-                
-                # After collecting all dates, find the earliest one
-                if all_found_dates:
-                    # Sort dates by datetime object (first element in each tuple)
-                    all_found_dates.sort(key=lambda x: x[0])
-                    
-                    # Get the earliest date (first element after sorting)
-                    earliest_date_tuple = all_found_dates[0]
-                    earliest_formatted_date = earliest_date_tuple[1]
-                    
-                    print(f"  Found the earliest date: {earliest_formatted_date}")
+                        if date_match.group('tm'):
+                            log.debug("  Found date with time in span #%s", len(date_spans) - i)
+                            earliest_date_tuple = parsed
+                            break
+                        
+                        # Keep date-only matches in case no span carries a time
+                        all_found_dates.append(parsed)
                     
-                    # Return to original URL before returning the date
-                    driver.get(original_url)
-                    time.sleep(3)
-                    return earliest_formatted_date
-                
-                # If we couldn't parse any dates for sorting, try another approach
-                # Try to identify a potential creation/posted event
-                try:
-                    # Use JavaScript to find specific text that might indicate the original posting
-                    find_creation_js = """
-                    const allDivs = document.querySelectorAll('div');
-                    for (const div of allDivs) {
-                        const text = div.textContent.toLowerCase();
-                        if (text.includes('posted') || text.includes('created') || text.includes('wrote') || 
-                            text.includes('answered') || text.includes('original answer') ||
-                            text.includes('first posted') || text.includes('initially answered')) {
-                            
-                            // Get the closest element containing a date
-                            let currentEl = div;
-                            let dateText = '';
-                            
-                            // Look in the element itself
-                            if (/(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\\s+\\d{1,2},\\s+\\d{4}/.test(text)) {
-                                dateText = text;
-                            } 
-                            // Look for a date in nearby elements
-                            else {
-                                const nearbyElements = [];
-                                // Check siblings
-                                if (currentEl.previousElementSibling) nearbyElements.push(currentEl.previousElementSibling);
-                                if (currentEl.nextElementSibling) nearbyElements.push(currentEl.nextElementSibling);
-                                // Check children
-                                for (const child of currentEl.children) {
-                                    nearbyElements.push(child);
-                                }
-                                
-                                for (const el of nearbyElements) {
-                                    const elText = el.textContent;
-                                    if (/(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\\s+\\d{1,2},\\s+\\d{4}/.test(elText)) {
-                                        dateText = elText;
-                                        break;
-                                    }
-                                }
-                            }
-                            
-                            if (dateText) {
-                                return { element: div.textContent, dateText: dateText };
-                            }
-                        }
-                    }
-                    return null;
-                    """
+                    # Without a dated-and-timed span, fall back to the earliest date seen
+                    if not earliest_date_tuple and all_found_dates:
+                        earliest_date_tuple = min(all_found_dates, key=lambda x: x[0])
                     
-                    creation_info = driver.execute_script(find_creation_js)
-                    if creation_info:
-                        print(f"Found creation indication: {creation_info['element']}")
-                        print(f"Date text: {creation_info['dateText']}")
+                    if earliest_date_tuple:
+                        earliest_formatted_date = earliest_date_tuple[1]
                         
-                        # Extract the date from the text
-                        date_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) (\d{1,2}), (\d{4})(?: at (\d{1,2}):(\d{2})(?::(\d{2}))? ([APM]{2}))?', creation_info['dateText'])
+                        log.debug("  Found the earliest date: %s", earliest_formatted_date)
                         
-                        if date_match:
-                            if date_match.group(4):  # If time is included
-                                formatted_date = f"{date_match.group(1)} {date_match.group(2)}, {date_match.group(3)} at {date_match.group(4)}:{date_match.group(5)}"
-                                if date_match.group(6):
-                                    formatted_date += f":{date_match.group(6)}"
-                                formatted_date += f" {date_match.group(7)}"
-                            else:
-                                formatted_date = f"{date_match.group(1)} {date_match.group(2)}, {date_match.group(3)}"
-                                
-                            print(f"  Successfully found post creation date: {formatted_date}")
-                            
-                            # Return to original URL before returning the date
-                            driver.get(original_url)
-                            time.sleep(3)
-                            return formatted_date
-                except Exception as e:
-                    print(f"Error looking for creation indication: {e}")
-        except Exception as e:
-            print(f"Error extracting date from log page: {e}")
-    
-    # If no date found in spans, try page source for the earliest date
-    try:
-        print("Trying to extract date from page source...")
-        all_matches = []
-        
-        # Look for date patterns in the page source (more comprehensive)
-        date_patterns = [
-            # With time: January 1, 2023 at 12:00 PM (most specific)
-            r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) (\d{1,2}), (\d{4}) at (\d{1,2}):(\d{2})(?::(\d{2}))? ([APM]{2})',
-            # Standard format: January 1, 2023
-            r'(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) (\d{1,2}), (\d{4})',
-            # Alternative format: 1 January 2023
-            r'(\d{1,2}) (January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec),? (\d{4})'
-        ]
+                        # Return to original URL before returning the date
+                        return_to_answer(driver, original_url, restore_url)
+                        return earliest_formatted_date
+            except Exception as e:
+                print(f"Error extracting date from log page: {e}")
         
-        # Find all dates in the page
-        all_date_objects = []
-
-        for pattern in date_patterns:
-            matches = re.findall(pattern, page_source)
-            for match in matches:
-                try:
-                    if len(match) >= 7:  # Full date with time format
-                        month = match[0]
-                        day = int(match[1])
-                        year = int(match[2])
-                        hour = int(match[3])
-                        minute = int(match[4])
-                        
-                        # Adjust for AM/PM
-                        if match[6] == "PM" and hour < 12:
-                            hour += 12
-                        elif match[6] == "AM" and hour == 12:
-                            hour = 0
-                            
-                        # Create a datetime object for comparison
-                        if match[5]:  # If seconds are included
-                            second = int(match[5])
-                        else:
-                            second = 0
-                        
-                        # Format the date string
-                        formatted_date = f"{month} {day}, {year} at {match[3]}:{match[4]}"
-                        if match[5]:
-                            formatted_date += f":{match[5]}"
-                        formatted_date += f" {match[6]}"
-                        
-                    elif len(match) >= 3:  # Simple date format
-                        if re.match(r'\d+', match[0]):  # If first group is a number (alternative format)
-                            day = int(match[0])
-                            month = match[1]
-                            year = int(match[2])
-                            formatted_date = f"{month} {day}, {year}"
-                        else:  # Standard format
-                            month = match[0]
-                            day = int(match[1])
-                            year = int(match[2])
-                            formatted_date = f"{month} {day}, {year}"
-                        
-                        hour, minute, second = 0, 0, 0  # Default to midnight
-                    
-                    # Convert month name to month number
-                    month_map = {
-                        'January': 1, 'February': 2, 'March': 3, 'April': 4, 'May': 5, 'June': 6,
-                        'July': 7, 'August': 8, 'September': 9, 'October': 10, 'November': 11, 'December': 12,
-                        'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
-                        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
-                    }
-                    
-                    if isinstance(month, str):
-                        month_num = month_map.get(month, 1)  # Default to 1 if not found
-                    else:
-                        month_num = month
-                    
-                    date_obj = datetime.datetime(year, month_num, day, hour, minute, second)
-                    all_date_objects.append((date_obj, formatted_date))
+        # If no date found in spans, try page source for the earliest date. Serializing the
+        # DOM is expensive, so skip it when the log page is behind a login wall anyway. The
+        # error texts aren't enough to skip it - revision text can mention "Error" too.
+        if not page_state['loginWall']:
+            try:
+                log.debug("Trying to extract date from page source...")
+                earliest_date = find_earliest_date(driver.page_source)
+                if earliest_date:
+                    log.debug("Successfully found earliest date from page source: %s", earliest_date)
                     
-                except Exception as e:
-                    print(f"    Error processing date match: {e}")
+                    # Return to original URL before returning the date
+                    return_to_answer(driver, original_url, restore_url)
+                    return earliest_date
+                else:
+                    log.debug("No usable date matches found in page source")
+            except Exception as e:
+                print(f"Error extracting date from page source: {e}")
+                import traceback
+                traceback.print_exc()
         
-        # Find the earliest date
-        if all_date_objects:
-            # Sort by datetime
-            all_date_objects.sort(key=lambda x: x[0])
-            earliest_date = all_date_objects[0][1]
-            print(f"Successfully found earliest date from page source: {earliest_date}")
-            
-            # Return to original URL before returning the date
-            driver.get(original_url)
-            time.sleep(3)
-            return earliest_date
-        else:
-            print("No usable date matches found in page source")
-    except Exception as e:
-        print(f"Error extracting date from page source: {e}")
-        import traceback
-        traceback.print_exc()
-    
-    # Navigate back to the original answer page
-    print(f"Navigating back to original URL: {original_url}")
-    driver.get(original_url)
-    time.sleep(3)
+        # Navigate back to the original answer page
+        if restore_url:
+            log.debug("Navigating back to original URL: %s", original_url)
+        return_to_answer(driver, original_url, restore_url)
+    finally:
+        # Never leave the log-page-only blocking on a pooled driver, even on errors
+        set_blocked_urls(driver)
     
     # If all methods fail, use current date with a prefix
     current_date = system_now.strftime("%B %d, %Y")
@@ -447,76 +761,40 @@ def extract_view_count(driver):
             
             if "views" in views_text.lower():
                 # Extract numeric part from "158 views"
-                views_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?(?:[KkMm])?)\s+views?', views_text)
+                views_match = VIEWS_RE.search(views_text)
                 if views_match:
-                    view_count = views_match.group(1)
-                    print(f"Found view count: {view_count}")
-                    
                     # Convert K/M notation to full numbers
-                    if 'k' in view_count.lower():
-                        numeric_views = float(view_count.lower().replace('k', '')) * 1000
-                        return str(int(numeric_views))
-                    elif 'm' in view_count.lower():
-                        numeric_views = float(view_count.lower().replace('m', '')) * 1000000
-                        return str(int(numeric_views))
-                    else:
-                        return view_count.replace(',', '')
+                    view_count = count_from_match(views_match)
+                    log.debug("Found view count: %s", view_count)
+                    return view_count
         except:
             pass
             
         # Try other selectors if the specific one fails
-        view_selectors = [
-            "//span[contains(text(), 'views')]",
-            "//div[contains(text(), 'views')]",
-            "//span[contains(@class, 'c1h7helg')]"
-        ]
-        
-        for selector in view_selectors:
+        for selector in VIEW_XPATHS:
             try:
                 elements = driver.find_elements(By.XPATH, selector)
                 for element in elements:
                     text = element.text.strip().lower()
                     if "views" in text:
-                        views_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?(?:[KkMm])?)\s+views?', text)
+                        views_match = VIEWS_RE.search(text)
                         if views_match:
-                            view_count = views_match.group(1)
-                            print(f"Found view count (alternative): {view_count}")
-                            
                             # Convert K/M notation to full numbers
-                            if 'k' in view_count.lower():
-                                numeric_views = float(view_count.lower().replace('k', '')) * 1000
-                                return str(int(numeric_views))
-                            elif 'm' in view_count.lower():
-                                numeric_views = float(view_count.lower().replace('m', '')) * 1000000
-                                return str(int(numeric_views))
-                            else:
-                                return view_count.replace(',', '')
+                            view_count = count_from_match(views_match)
+                            log.debug("Found view count (alternative): %s", view_count)
+                            return view_count
             except:
                 continue
                 
         # Try JavaScript if all else fails
-        views_js = """
-        return Array.from(document.querySelectorAll('*'))
-            .filter(el => el.textContent && el.textContent.includes('views'))
-            .map(el => el.textContent.trim())
-            .find(text => /\\d+\\s+views/.test(text));
-        """
-        views_text = driver.execute_script(views_js)
+        views_text = run_finder(driver, "views")
         if views_text:
-            views_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?(?:[KkMm])?)\s+views?', views_text)
+            views_match = VIEWS_RE.search(views_text)
             if views_match:
-                view_count = views_match.group(1)
-                print(f"Found view count (JavaScript): {view_count}")
-                
                 # Convert K/M notation to full numbers
-                if 'k' in view_count.lower():
-                    numeric_views = float(view_count.lower().replace('k', '')) * 1000
-                    return str(int(numeric_views))
-                elif 'm' in view_count.lower():
-                    numeric_views = float(view_count.lower().replace('m', '')) * 1000000
-                    return str(int(numeric_views))
-                else:
-                    return view_count.replace(',', '')
+                view_count = count_from_match(views_match)
+                log.debug("Found view count (JavaScript): %s", view_count)
+                return view_count
         
         return "0"
         
@@ -524,6 +802,45 @@ def extract_view_count(driver):
         print(f"Error extracting view count: {e}")
         return "0"
 
+def extract_all_counts(driver):
+    """
+    Read the upvote, comment and share counts with one script call, combining the
+    JavaScript finders of the individual extractors with a single text sweep. Counts that can't be found
+    are None, so callers can fall back to the per-count extractors for just those.
+    """
+    try:
+        counts = run_finder(driver, "counts")
+    except Exception as e:
+        print(f"Error extracting answer counts: {e}")
+        return {'upvotes': None, 'comments': None, 'shares': None}
+    return counts_from_finder(counts)
+
+def counts_from_finder(counts):
+    """Turn the raw result of the counts finder into plain digit strings, or None where missing"""
+    for kind, value in counts.items():
+        if not value or value.isdigit():
+            continue
+        # Text such as "1.2K shares" still needs the number pulled out of it
+        count_match = COUNT_TEXT_RE.search(value)
+        counts[kind] = count_from_match(count_match) if count_match else None
+    return counts
+
+def probe_answer_page(driver, answer_url):
+    """
+    Check the loaded answer page for a deletion notice and read its author, views,
+    creation date and counts, all in one script call. Returns None if the call fails.
+    """
+    try:
+        probe = run_finder(driver, "answer", AUTHOR_SELECTORS, answer_url, DELETION_XPATH)
+        return {
+            'deleted': probe['deleted'],
+            'meta': meta_from_finder(probe['meta']),
+            'counts': counts_from_finder(probe['counts']),
+        }
+    except Exception as e:
+        print(f"Error probing answer page: {e}")
+        return None
+
 def extract_upvote_count(driver):
     """Extract the number of upvotes from the answer page"""
     try:
@@ -535,131 +852,56 @@ def extract_upvote_count(driver):
             upvote_count = upvote_element.text.strip()
             # Make sure it looks like a valid count (digits only)
             if upvote_count and upvote_count.isdigit() and len(upvote_count) < 10:  # Avoid large ID numbers
-                print(f"Found upvote count from specific XPath: {upvote_count}")
+                log.debug("Found upvote count from specific XPath: %s", upvote_count)
                 return upvote_count
         except:
-            print("Could not find upvote count using specific XPath")
+            log.debug("Could not find upvote count using specific XPath")
             
         # Add a specific JavaScript finder based on the HTML structure provided in the example
         try:
-            js_specific_finder = """
-            // Find upvote buttons by aria-label
-            let upvoteButtons = Array.from(document.querySelectorAll('button[aria-label*="Upvote" i]'));
-            
-            for (let button of upvoteButtons) {
-                // Look for spans that are visible and contain only digits
-                const visibleSpans = Array.from(button.querySelectorAll('span'))
-                    .filter(span => {
-                        // Only get spans with numeric text that are visible
-                        const text = span.textContent.trim();
-                        return text.match(/^\\d+$/) && 
-                               text.length < 10 &&  // Avoid large ID numbers
-                               getComputedStyle(span).opacity !== '0' && 
-                               getComputedStyle(span).display !== 'none' &&
-                               getComputedStyle(span).visibility !== 'hidden';
-                    });
-                
-                if (visibleSpans.length > 0) {
-                    return visibleSpans[0].textContent.trim();
-                }
-                
-                // Also try to find the span with the exact structure from the example
-                const specificSpans = Array.from(button.querySelectorAll('.q-text.qu-whiteSpace--nowrap.qu-display--inline-flex.qu-alignItems--center.qu-justifyContent--center'))
-                    .filter(span => {
-                        const text = span.textContent.trim();
-                        return text.match(/^\\d+$/) && text.length < 10;  // Avoid large ID numbers
-                    });
-                    
-                if (specificSpans.length > 0) {
-                    return specificSpans[0].textContent.trim();
-                }
-            }
-            
-            return null;
-            """
-            specific_count = driver.execute_script(js_specific_finder)
+            specific_count = run_finder(driver, "upvote_specific")
             if specific_count:
-                print(f"Found upvote count via specific HTML structure: {specific_count}")
+                log.debug("Found upvote count via specific HTML structure: %s", specific_count)
                 return specific_count
         except Exception as e:
-            print(f"Specific HTML structure extraction failed: {e}")
+            log.debug("Specific HTML structure extraction failed: %s", e)
             
         # Try a more general approach with JavaScript to find upvote numbers in buttons
         try:
-            js_upvote_finder = """
-            // Function to check if an element or its parent contains 'Upvote' text
-            function hasUpvoteText(el) {
-                if (!el) return false;
-                if (el.textContent.includes('Upvote')) return true;
-                if (el.parentElement && el.parentElement.textContent.includes('Upvote')) return true;
-                return false;
-            }
-            
-            // Find all visible spans with just numbers that are near 'Upvote' text
-            const allSpans = Array.from(document.querySelectorAll('span'));
-            const upvoteSpans = allSpans.filter(span => {
-                const text = span.textContent.trim();
-                return text.match(/^\\d+$/) && 
-                       text.length < 10 &&  // Avoid large ID numbers
-                       getComputedStyle(span).opacity !== '0' &&
-                       hasUpvoteText(span.parentElement);
-            });
-            
-            if (upvoteSpans.length > 0) {
-                return upvoteSpans[0].textContent.trim();
-            }
-            
-            return null;
-            """
-            upvote_count = driver.execute_script(js_upvote_finder)
+            upvote_count = run_finder(driver, "upvote_general")
             if upvote_count:
-                print(f"Found upvote count via general JavaScript: {upvote_count}")
+                log.debug("Found upvote count via general JavaScript: %s", upvote_count)
                 return upvote_count
         except Exception as e:
-            print(f"General JavaScript upvote extraction failed: {e}")
+            log.debug("General JavaScript upvote extraction failed: %s", e)
         
         # Check for upvote count in button text directly
         try:
-            upvote_buttons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'Upvote')]")
+            upvote_buttons = driver.find_elements(By.CSS_SELECTOR, "button[aria-label*='Upvote']")
             for button in upvote_buttons:
                 button_text = button.text.strip()
                 # Extract all digits from button text
-                digits = ''.join(c for c in button_text if c.isdigit())
+                digits = NON_DIGITS_RE.sub('', button_text)
                 if digits and len(digits) < 10:  # Avoid large ID numbers
-                    print(f"Extracted upvote count from button text: {digits}")
+                    log.debug("Extracted upvote count from button text: %s", digits)
                     return digits
         except:
             pass
         
-        # Check for "View X upvotes" text
-        upvote_selectors = [
-            "//span[contains(text(), 'upvotes')]",
-            "//div[contains(text(), 'upvotes')]",
-            "//div[contains(@class, 'qu-color--gray_light')]//span[contains(@class, 'c1h7helg')][contains(text(), 'upvotes')]"
-        ]
-        
-        for selector in upvote_selectors:
-            try:
-                elements = driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    text = element.text.strip().lower()
-                    if "upvote" in text:
-                        upvotes_match = re.search(r'(?:view\s+)?(\d+(?:,\d+)*(?:\.\d+)?(?:[KkMm])?)\s+upvotes?', text, re.IGNORECASE)
-                        if upvotes_match:
-                            upvote_count = upvotes_match.group(1)
-                            print(f"Found upvote count from text: {upvote_count}")
-                            
-                            # Convert K/M notation to full numbers
-                            if 'k' in upvote_count.lower():
-                                numeric_upvotes = float(upvote_count.lower().replace('k', '')) * 1000
-                                return str(int(numeric_upvotes))
-                            elif 'm' in upvote_count.lower():
-                                numeric_upvotes = float(upvote_count.lower().replace('m', '')) * 1000000
-                                return str(int(numeric_upvotes))
-                            else:
-                                return upvote_count.replace(',', '')
-            except:
-                continue
+        # Check for "View X upvotes" text, all selectors in one query
+        try:
+            elements = driver.find_elements(By.XPATH, UPVOTE_TEXT_XPATH)
+            for element in elements:
+                text = element.text.strip().lower()
+                if "upvote" in text:
+                    upvotes_match = UPVOTES_RE.search(text)
+                    if upvotes_match:
+                        # Convert K/M notation to full numbers
+                        upvote_count = count_from_match(upvotes_match)
+                        log.debug("Found upvote count from text: %s", upvote_count)
+                        return upvote_count
+        except:
+            pass
         
         # Return 0 for any case where we can't find a valid upvote count
         return "0"
@@ -678,127 +920,72 @@ def extract_comment_count(driver):
             comment_element = driver.find_element(By.XPATH, comment_xpath)
             comment_count = comment_element.text.strip()
             if comment_count and comment_count.isdigit():
-                print(f"Found comment count from specific XPath: {comment_count}")
+                log.debug("Found comment count from specific XPath: %s", comment_count)
                 return comment_count
         except:
-            print("Could not find comment count using specific XPath")
+            log.debug("Could not find comment count using specific XPath")
         
         # Add a specific JavaScript finder based on the HTML structure provided in the example
         try:
-            js_specific_finder = """
-            // Find comment buttons by aria-label
-            let commentButtons = Array.from(document.querySelectorAll('button[aria-label*="comment" i]'));
-            
-            for (let button of commentButtons) {
-                // Look for the structure matching the example: 
-                // The visible span inside the second div of the button content
-                const visibleSpans = Array.from(button.querySelectorAll('div > div:nth-child(2) > span:not([class*="visibility--hidden"])'))
-                    .filter(span => span.textContent.trim().match(/^\\d+$/));
-                
-                if (visibleSpans.length > 0) {
-                    return visibleSpans[0].textContent.trim();
-                }
-            }
-            
-            return null;
-            """
-            specific_count = driver.execute_script(js_specific_finder)
+            specific_count = run_finder(driver, "comment_specific")
             if specific_count:
-                print(f"Found comment count via specific HTML structure: {specific_count}")
+                log.debug("Found comment count via specific HTML structure: %s", specific_count)
                 return specific_count
         except Exception as e:
-            print(f"Specific HTML structure extraction failed: {e}")
+            log.debug("Specific HTML structure extraction failed: %s", e)
         
         # Try more general selectors for the comment number inside comment buttons
         try:
             # Look for the second span in a div inside a comment button which contains the number
-            comment_spans = driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'comment') or contains(@aria-label, 'Comment')]//div[contains(@class, 'q-text')]//span[contains(@class, 'q-text') and not(contains(@class, 'qu-visibility--hidden'))]")
+            comment_spans = driver.find_elements(By.CSS_SELECTOR, "button[aria-label*='comment' i] div[class*='q-text'] span[class*='q-text']:not([class*='qu-visibility--hidden'])")
             for span in comment_spans:
                 text = span.text.strip()
                 if text and text.isdigit():
-                    print(f"Found comment count from button span: {text}")
+                    log.debug("Found comment count from button span: %s", text)
                     return text
         except:
-            print("Could not find comment count in button spans")
+            log.debug("Could not find comment count in button spans")
         
         # Check for comment count in button text directly
         try:
-            comment_buttons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'Comment') or contains(@aria-label, 'comment')]")
+            comment_buttons = driver.find_elements(By.CSS_SELECTOR, "button[aria-label*='comment' i]")
             for button in comment_buttons:
                 button_text = button.text.strip()
                 if button_text and button_text.isdigit():
-                    print(f"Found comment count from button text: {button_text}")
+                    log.debug("Found comment count from button text: %s", button_text)
                     return button_text
                 
                 # Try to extract just the digits if there's other text
-                digits = ''.join(c for c in button_text if c.isdigit())
+                digits = NON_DIGITS_RE.sub('', button_text)
                 if digits:
-                    print(f"Extracted digits from button text: {digits}")
+                    log.debug("Extracted digits from button text: %s", digits)
                     return digits
         except:
-            print("Could not find comment count in button text")
+            log.debug("Could not find comment count in button text")
         
         # Try using JavaScript to find the comment count inside the button
         try:
-            js_comment_finder = """
-            // Find comment buttons by aria-label
-            let commentButtons = Array.from(document.querySelectorAll('button[aria-label*="comment" i], button[aria-label*="Comment" i]'));
-            
-            for (let button of commentButtons) {
-                // Find spans with text content that is just a number
-                let spans = Array.from(button.querySelectorAll('span'));
-                for (let span of spans) {
-                    let text = span.textContent.trim();
-                    if (text && /^\\d+$/.test(text) && getComputedStyle(span).opacity !== '0') {
-                        return text;
-                    }
-                }
-                
-                // Also check for number in the button text
-                let buttonText = button.textContent.trim();
-                let match = buttonText.match(/\\d+/);
-                if (match) {
-                    return match[0];
-                }
-            }
-            
-            return null;
-            """
-            comment_count = driver.execute_script(js_comment_finder)
+            comment_count = run_finder(driver, "comment_general")
             if comment_count:
-                print(f"Found comment count via JavaScript: {comment_count}")
+                log.debug("Found comment count via JavaScript: %s", comment_count)
                 return comment_count
         except Exception as e:
-            print(f"JavaScript comment extraction failed: {e}")
+            log.debug("JavaScript comment extraction failed: %s", e)
         
-        # Try general selectors for text containing "comments"
-        comment_selectors = [
-            "//span[contains(text(), 'comments')]",
-            "//div[contains(text(), 'comments')]"
-        ]
-        
-        for selector in comment_selectors:
-            try:
-                elements = driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    text = element.text.strip().lower()
-                    if "comment" in text:
-                        comments_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?(?:[KkMm])?)\s+comments?', text, re.IGNORECASE)
-                        if comments_match:
-                            comment_count = comments_match.group(1)
-                            print(f"Found comment count from text: {comment_count}")
-                            
-                            # Convert K/M notation to full numbers
-                            if 'k' in comment_count.lower():
-                                numeric_comments = float(comment_count.lower().replace('k', '')) * 1000
-                                return str(int(numeric_comments))
-                            elif 'm' in comment_count.lower():
-                                numeric_comments = float(comment_count.lower().replace('m', '')) * 1000000
-                                return str(int(numeric_comments))
-                            else:
-                                return comment_count.replace(',', '')
-            except:
-                continue
+        # Try general selectors for text containing "comments", all selectors in one query
+        try:
+            elements = driver.find_elements(By.XPATH, COMMENT_TEXT_XPATH)
+            for element in elements:
+                text = element.text.strip().lower()
+                if "comment" in text:
+                    comments_match = COMMENTS_RE.search(text)
+                    if comments_match:
+                        # Convert K/M notation to full numbers
+                        comment_count = count_from_match(comments_match)
+                        log.debug("Found comment count from text: %s", comment_count)
+                        return comment_count
+        except:
+            pass
         
         # Default to 0 if no comment count found
         return "0"
@@ -810,70 +997,41 @@ def extract_comment_count(driver):
 def extract_share_count(driver):
     """Extract the number of shares from the answer page"""
     try:
-        # Check for "View X shares" text
-        share_selectors = [
-            "//span[contains(text(), 'shares')]", 
-            "//div[contains(text(), 'shares')]",
-            "//div[contains(@class, 'qu-color--gray_light')]//span[contains(@class, 'c1h7helg')][contains(text(), 'shares')]"
-        ]
-        
-        for selector in share_selectors:
-            try:
-                elements = driver.find_elements(By.XPATH, selector)
-                for element in elements:
-                    text = element.text.strip().lower()
-                    if "shares" in text:
-                        shares_match = re.search(r'(?:view\s+)?(\d+(?:,\d+)*(?:\.\d+)?(?:[KkMm])?)\s+shares?', text, re.IGNORECASE)
-                        if shares_match:
-                            share_count = shares_match.group(1)
-                            print(f"Found share count: {share_count}")
-                            
-                            # Convert K/M notation to full numbers
-                            if 'k' in share_count.lower():
-                                numeric_shares = float(share_count.lower().replace('k', '')) * 1000
-                                return str(int(numeric_shares))
-                            elif 'm' in share_count.lower():
-                                numeric_shares = float(share_count.lower().replace('m', '')) * 1000000
-                                return str(int(numeric_shares))
-                            else:
-                                return share_count.replace(',', '')
-            except:
-                continue
+        # Check for "View X shares" text, all selectors in one query
+        try:
+            elements = driver.find_elements(By.XPATH, SHARE_TEXT_XPATH)
+            for element in elements:
+                text = element.text.strip().lower()
+                if "shares" in text:
+                    shares_match = SHARES_RE.search(text)
+                    if shares_match:
+                        # Convert K/M notation to full numbers
+                        share_count = count_from_match(shares_match)
+                        log.debug("Found share count: %s", share_count)
+                        return share_count
+        except:
+            pass
                 
         # Try to find share button with count
         try:
-            share_buttons = driver.find_elements(By.XPATH, "//button[contains(@aria-label, 'Share')]")
+            share_buttons = driver.find_elements(By.CSS_SELECTOR, "button[aria-label*='Share']")
             for button in share_buttons:
                 button_text = button.text.strip()
                 if button_text and button_text.isdigit():
-                    print(f"Found share count from button: {button_text}")
+                    log.debug("Found share count from button: %s", button_text)
                     return button_text
         except:
             pass
             
         # Try JavaScript if all else fails
-        shares_js = """
-        return Array.from(document.querySelectorAll('*'))
-            .filter(el => el.textContent && el.textContent.includes('share'))
-            .map(el => el.textContent.trim())
-            .find(text => /\\d+\\s+share/.test(text));
-        """
-        shares_text = driver.execute_script(shares_js)
+        shares_text = run_finder(driver, "shares")
         if shares_text:
-            shares_match = re.search(r'(\d+(?:,\d+)*(?:\.\d+)?(?:[KkMm])?)\s+shares?', shares_text, re.IGNORECASE)
+            shares_match = SHARES_RE.search(shares_text)
             if shares_match:
-                share_count = shares_match.group(1)
-                print(f"Found share count (JavaScript): {share_count}")
-                
                 # Convert K/M notation to full numbers
-                if 'k' in share_count.lower():
-                    numeric_shares = float(share_count.lower().replace('k', '')) * 1000
-                    return str(int(numeric_shares))
-                elif 'm' in share_count.lower():
-                    numeric_shares = float(share_count.lower().replace('m', '')) * 1000000
-                    return str(int(numeric_shares))
-                else:
-                    return share_count.replace(',', '')
+                share_count = count_from_match(shares_match)
+                log.debug("Found share count (JavaScript): %s", share_count)
+                return share_count
         
         # Default to 0 if no share count found
         return "0"
@@ -882,6 +1040,7 @@ def extract_share_count(driver):
         print(f"Error extracting share count: {e}")
         return "0"
 
+@functools.lru_cache(maxsize=8192)
 def extract_base_url(answer_url):
     """
     Extract the base thread URL from a Quora answer URL
@@ -890,91 +1049,202 @@ def extract_base_url(answer_url):
     becomes 
     https://www.quora.com/Is-trading-on-OctaFX-halal
     """
+    # Answer URLs have a fixed shape, so the thread URL is everything before /answer/
+    if '/answer/' in answer_url:
+        base_url = answer_url.split('/answer/', 1)[0]
+        log.debug("Extracted base URL: %s", base_url)
+        return base_url
+    
+    # If it's not an answer URL, return the original
+    log.debug("Not an answer URL, returning original: %s", answer_url)
+    return answer_url
+
+def format_iso_date(iso_date):
+    """Format an ISO 8601 timestamp the way the log page shows dates, e.g. April 5, 2023 at 3:04 PM"""
+    created = datetime.datetime.fromisoformat(iso_date.replace('Z', '+00:00'))
+    # Log pages show the browser's local time, so convert the (usually UTC) timestamp to match
+    if created.tzinfo:
+        created = created.astimezone()
+    return f"{created:%B} {created.day}, {created.year} at {created.hour % 12 or 12}:{created:%M %p}"
+
+def find_embedded_post_date(html, answer_url):
+    """Read the answer's creation date from the structured data embedded in its page, if present"""
+    answer = find_answer_ld(html, answer_url)
+    if not answer:
+        return None
+    
+    iso_date = answer.get('dateCreated') or answer.get('datePublished')
+    return format_iso_date(iso_date) if iso_date else None
+
+def find_answer_ld(html, answer_url):
+    """Find the JSON-LD Answer object for answer_url in the raw page HTML"""
+    answer_path = unquote(urlparse(answer_url).path).rstrip('/').lower()
+
+    for block in LD_JSON_RE.findall(html):
+        try:
+            data = json.loads(block)
+        except ValueError:
+            continue
+
+        # Walk the structured data looking for the matching Answer node
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                if node.get('@type') == 'Answer':
+                    node_path = unquote(urlparse(node.get('url', '')).path).rstrip('/').lower()
+                    if node_path == answer_path:
+                        return node
+                stack.extend(node.values())
+
+    return None
+
+def find_answer_markup(html, answer_url):
+    """
+    Cut the markup of the answer at answer_url out of the raw page HTML - from its
+    first link up to the first link to another answer - or None if it isn't linked
+    """
+    answer_path = unquote(urlparse(answer_url).path).rstrip('/').lower()
+    markup = LD_JSON_RE.sub('', html)
+
+    start = None
+    for match in ANSWER_LINK_RE.finditer(markup):
+        link_path = unquote(urlparse(match.group(1)).path).rstrip('/').lower()
+        if start is None:
+            if link_path == answer_path:
+                start = match.start()
+        elif link_path != answer_path:
+            return markup[start:match.start()]
+
+    return markup[start:] if start is not None else None
+
+def parse_html(html, url):
+    """
+    Parse a Quora answer page fetched over plain HTTP.
+    Returns the same result dict as scrape_quora_answer (post_date is None when
+    the page doesn't embed it), or None when the page needs a browser (login
+    wall, deleted answer or data only rendered by JS).
+    """
     try:
-        # Parse the URL into components
-        parsed_url = urlparse(answer_url)
-        
-        # Check if this is a Quora answer URL
-        path = parsed_url.path
-        if '/answer/' in path:
-            # Split the path at /answer/ and take the first part
-            base_path = path.split('/answer/')[0]
-            
-            # Reconstruct the URL with the base path
-            base_url = urlunsplit((
-                parsed_url.scheme,
-                parsed_url.netloc,
-                base_path,
-                parsed_url.query,
-                parsed_url.fragment
-            ))
-            
-            print(f"Extracted base URL: {base_url}")
-            return base_url
-        else:
-            # If it's not an answer URL, return the original
-            print(f"Not an answer URL, returning original: {answer_url}")
-            return answer_url
-            
+        if LOGIN_WALL_RE.search(html):
+            return None
+
+        answer = find_answer_ld(html, url)
+        if not answer:
+            return None
+
+        author = answer.get('author')
+        author_name = author.get('name') if isinstance(author, dict) else None
+        date_created = answer.get('dateCreated')
+        upvotes = answer.get('upvoteCount')
+        comments = answer.get('commentCount')
+
+        # Related answers on the page have their own counts, so only read this answer's markup
+        markup = find_answer_markup(html, url)
+        views_match = VIEWS_RE.search(markup) if markup else None
+
+        # Everything below has a browser fallback, so only accept complete pages.
+        # A missing creation date is left as None for the caller to look up on the log page
+        if not author_name or not views_match or upvotes is None or comments is None:
+            return None
+
+        post_date = format_iso_date(date_created) if date_created else None
+
+        # Convert K/M notation to full numbers
+        view_count = count_from_match(views_match)
+
+        shares_match = SHARES_RE.search(markup)
+        share_count = count_from_match(shares_match) if shares_match else "0"
+
+        return {
+            "answer_url": url,
+            "base_url": extract_base_url(url),
+            "author": author_name,
+            "post_date": post_date,
+            "stats": {
+                "views": view_count,
+                "upvotes": str(upvotes),
+                "comments": str(comments),
+                "shares": share_count
+            },
+            "scraped_at": datetime.datetime.now().isoformat(),
+            "is_deleted": False
+        }
+
     except Exception as e:
-        print(f"Error extracting base URL: {e}")
-        return answer_url
+        print(f"Error parsing HTML for {url}: {e}")
+        return None
 
 def scrape_quora_answer(driver, url):
     """Scrape data from a specific Quora answer URL"""
     try:
-        print(f"\nNavigating to: {url}")
+        log.info("Navigating to: %s", url)
         driver.get(url)
         
-        # Wait for the page to load
-        WebDriverWait(driver, 15).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        
-        # Add a small delay to ensure dynamic content loads
-        time.sleep(3)
+        # Wait for the counts (or a deletion notice) to render instead of a fixed delay
+        if not wait_for_counts_ready(driver):
+            log.debug("Timed out waiting for the answer's counts to render")
         
-        print(f"Current URL: {driver.current_url}")
-        print(f"Page title: {driver.title}")
+        # Each of these is a WebDriver round trip, so only ask for them when they'll be shown
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Current URL: %s", driver.current_url)
+            log.debug("Page title: %s", driver.title)
         
         # Extract the base URL for the thread
         base_url = extract_base_url(url)
         
-        # Check if the answer is deleted
-        is_deleted = False
-        try:
-            deletion_indicators = [
-                "//div[contains(text(), 'Quora deleted this answer')]",
-                "//div[contains(text(), 'deleted by Quora Moderation')]",
-                "//div[contains(text(), 'Quora deleted this')]"
-            ]
-            
-            for indicator in deletion_indicators:
-                deletion_elements = driver.find_elements(By.XPATH, indicator)
-                if deletion_elements:
-                    print("Found deletion notice: Answer has been deleted")
-                    is_deleted = True
-                    break
-        except Exception as e:
-            print(f"Error checking for deletion status: {e}")
+        # Check if the answer is deleted and read its data in the same script call
+        probe = probe_answer_page(driver, url)
+        
+        # The counts can still be filling in right after the button appears - one short retry
+        if probe and not probe['deleted'] and not any(probe['counts'].values()):
+            time.sleep(0.25)
+            probe = probe_answer_page(driver, url) or probe
+        if probe is None:
+            # Fall back to checking for deletion on its own and reading the data separately
+            probe = {'deleted': False, 'meta': None, 'counts': None}
+            try:
+                probe['deleted'] = bool(driver.find_elements(By.XPATH, DELETION_XPATH))
+            except Exception as e:
+                print(f"Error checking for deletion status: {e}")
+        
+        is_deleted = probe['deleted']
+        if is_deleted:
+            log.info("Found deletion notice: Answer has been deleted")
         
         # Extract stats - handle differently based on deletion status
+        log_date_future = None
         if is_deleted:
             author_name = "POST DELETED"
             view_count = "0"
             upvote_count = "0"
             comment_count = "0"
             share_count = "0"
-            # Still try to extract the post date
-            post_date = extract_post_date(driver, url)
+            meta = {'post_date': None}
         else:
-            # Normal extraction for non-deleted posts
-            author_name = extract_author_name(driver)
-            post_date = extract_post_date(driver, url)
-            view_count = extract_view_count(driver)
-            upvote_count = extract_upvote_count(driver)
-            comment_count = extract_comment_count(driver)
-            share_count = extract_share_count(driver)
+            # Normal extraction for non-deleted posts - the per-field extractors only
+            # run for whatever the probe couldn't find
+            meta = probe['meta'] or extract_all_meta(driver, url)
+            
+            # Without an embedded date, the log page downloads while the browser reads the rest
+            if not meta['post_date']:
+                log_date_future = prefetch_log_page_date(driver, url)
+            
+            author_name = meta['author'] or extract_author_name(driver)
+            view_count = meta['views'] or extract_view_count(driver)
+            counts = probe['counts'] or extract_all_counts(driver)
+            upvote_count = counts['upvotes'] or extract_upvote_count(driver)
+            comment_count = counts['comments'] or extract_comment_count(driver)
+            share_count = counts['shares'] or extract_share_count(driver)
+        
+        # The date comes last since it may leave for the log page - nothing else
+        # needs the answer page afterwards, so don't navigate back to it. The probe
+        # already looked for the embedded date unless the answer was deleted
+        post_date = meta['post_date'] or extract_post_date(
+            driver, url, restore_url=False, check_embedded=is_deleted, log_date_future=log_date_future
+        )
         
         # Format current timestamp
         scraped_at = datetime.datetime.now().isoformat()
@@ -995,24 +1265,15 @@ def scrape_quora_answer(driver, url):
             "is_deleted": is_deleted
         }
         
-        print("\nExtracted data:")
-        print(f"Answer URL: {url}")
-        print(f"Thread URL: {base_url}")
-        print(f"Author: {author_name}")
-        
         # Format date message based on the result
-        if post_date.startswith("Approx:"):
-            print(f"Post date: {post_date}")
-        else:
-            print(f"Post date: {post_date} (exact date from log)")
-            
-        print(f"Views: {view_count}")
-        print(f"Upvotes: {upvote_count}")
-        print(f"Comments: {comment_count}")
-        print(f"Shares: {share_count}")
-        print(f"Scraped at: {scraped_at}")
-        if is_deleted:
-            print(f"Status: DELETED")
+        date_note = "" if post_date.startswith("Approx.") else " (exact date from log)"
+        log.info(
+            "Extracted data:\n  Answer URL: %s\n  Thread URL: %s\n  Author: %s\n  Post date: %s%s\n"
+            "  Views: %s\n  Upvotes: %s\n  Comments: %s\n  Shares: %s\n  Scraped at: %s%s",
+            url, base_url, author_name, post_date, date_note,
+            view_count, upvote_count, comment_count, share_count, scraped_at,
+            "\n  Status: DELETED" if is_deleted else ""
+        )
         
         return result
         